@@ -1,10 +1,7 @@
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-
 from fastapi import APIRouter, Request, HTTPException
 from fastapi.templating import Jinja2Templates
 from fastapi.responses import HTMLResponse
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache
 from pathlib import Path
 
 router = APIRouter()
@@ -12,7 +9,21 @@ router = APIRouter()
 # Get project root directory - go up from frontend/routes/web.py to project root
 project_root = Path(__file__).parent.parent.parent
 templates_dir = project_root / "frontend" / "templates"
-templates = Jinja2Templates(directory=str(templates_dir))
+
+# Templates are static at runtime: skip mtime checks on every render and keep
+# compiled bytecode on disk so restarts don't re-parse the template sources
+template_env = Environment(
+    loader=FileSystemLoader(str(templates_dir)),
+    auto_reload=False,
+    bytecode_cache=FileSystemBytecodeCache(),
+    cache_size=-1,
+    autoescape=True,
+)
+templates = Jinja2Templates(env=template_env)
+
+# Pre-compile served pages so the first request only executes cached code
+for template_name in ("index.html", "redoc.html"):
+    template_env.get_template(template_name)
 
 @router.get("/", response_class=HTMLResponse)
 async def executive_dashboard(request: Request):
@@ -9,61 +9,53 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from app.routes import health, audit
+from app.openapi_text import API_DESCRIPTION
 from frontend.routes import web
 from config.config import settings
+from clients.service_factory import close_shared_openai, get_llm_client, get_mcp_client
+from business.audit_logic import AuditService
 from middleware.logging_middleware import LoggingMiddleware
 from utils.logger import get_logger
+from utils.static_files import CachedStaticFiles
 
 logger = get_logger(__name__)
 
-app = FastAPI(
-    title="Enterprise Web Audit Platform",
-    description="""## Enterprise Web Audit Platform API
-    
-**Simple REST API** for comprehensive web performance and security auditing.
 
-### Available Endpoints
-
-#### 🔍 **POST /audit**
-- **Input**: `{"url": "https://example.com"}`
-- **Output**: Complete audit report with performance, security, and recommendations
-- **Features**: Core Web Vitals, security headers, vulnerability assessment, executive summary
-
-#### ❤️ **GET /health**
-- **Output**: Service health status and component availability
-- **Use**: Monitoring, load balancer health checks
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Manage long-lived clients for the lifetime of the application.
+    
+    Starts the MCP client once and keeps it warm across audits, so each
+    request reuses the running MCP server and browser instead of spawning
+    a new one. The audit service is wired to it here, once per process.
+    The MCP client and the shared OpenAI connection pool are closed when
+    the application stops.
+    """
+    app.state.mcp_client = get_mcp_client()
+    app.state.audit_service = AuditService(app.state.mcp_client, get_llm_client())
+    try:
+        # Connect and cache the tool list before the first audit arrives
+        await app.state.mcp_client.get_available_tools()
+        logger.info("✓ MCP client warmed up")
+    except Exception as e:
+        logger.warning("[startup] MCP warm-up failed, will retry on first audit: %s", str(e))
+    
+    yield
+    
+    await close_shared_openai()
+    await app.state.mcp_client.close()
+    logger.info("✓ Clients shut down")
 
-#### 📋 **GET /**
-- **Output**: API information and available endpoints
-- **Use**: Service discovery and API metadata
 
-### Response Structure
-```json
-{
-  "audit_id": "unique-audit-identifier",
-  "url": "https://audited-site.com",
-  "performance": {
-    "core_web_vitals": {"lcp": 2.1, "fid": 45, "cls": 0.05},
-    "lighthouse_score": 85,
-    "overall_grade": "B"
-  },
-  "security": {
-    "https_enabled": true,
-    "risk_level": "low",
-    "vulnerabilities": []
-  },
-  "recommendations": [],
-  "executive_summary": {
-    "business_impact": "Performance optimization needed",
-    "investment_priority": "medium"
-  }
-}
-```
-    """,
+app = FastAPI(
+    title="Enterprise Web Audit Platform",
+    description=API_DESCRIPTION,
     version="1.0.0",
     contact={
         "name": "Web Audit Platform",
@@ -74,26 +66,33 @@ app = FastAPI(
         "url": "https://opensource.org/licenses/MIT",
     },
     docs_url=None,
-    redoc_url=None
+    redoc_url=None,
+    openapi_url="/openapi.json" if settings.expose_openapi else None,
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse  # C-accelerated JSON encoding for all API responses
 )
 
-# Add logging middleware first for request/response tracking
+# Compress JSON, HTML and static text responses above 1 KB. Registered first
+# so it wraps the app directly and sees complete bodies for the size check.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+# Add logging middleware for request/response tracking
 app.add_middleware(LoggingMiddleware)
 
-# Enable CORS for web interface and API access
+# Enable CORS for web interface and API access from known origins only
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=settings.cors_origins,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["Content-Type", "Authorization"],
 )
 
 # Serve static assets (CSS, JS, images) for web interface
 from pathlib import Path
 project_root = Path(__file__).parent.parent.parent
 static_dir = project_root / "frontend" / "static"
-app.mount("/static", StaticFiles(directory=str(static_dir)), name="static")
+app.mount("/static", CachedStaticFiles(directory=str(static_dir)), name="static")
 
 # Register route handlers for web interface, health checks, and audit API
 app.include_router(web.router, tags=["web"])
@@ -104,10 +103,15 @@ app.include_router(audit.router, tags=["audit"])
 if __name__ == "__main__":
     import uvicorn
     logger.info("✓ Web Audit Agent starting up")
-    logger.info("✓ Server configuration: %s:%d", settings.api_host, settings.api_port)
+    logger.info("✓ Server configuration: %s:%d (workers=%d)",
+                settings.api_host, settings.api_port, settings.api_workers)
     uvicorn.run(
         "main:app",
         host=settings.api_host,
         port=settings.api_port,
-        reload=True
+        loop="auto",  # uvloop when installed, otherwise the standard asyncio loop
+        http="httptools",  # C HTTP parser instead of h11
+        access_log=settings.api_access_log,
+        reload=settings.api_reload,
+        workers=settings.api_workers  # Separate processes for CPU-bound serialization/rendering
     )
\ No newline at end of file
@@ -0,0 +1,66 @@
+"""OpenAPI description text for the Web Audit Agent API.
+
+Long Markdown descriptions shown in the API documentation, kept as module
+constants so route and application modules stay compact and the strings
+are created once at import.
+"""
+
+API_DESCRIPTION = """## Enterprise Web Audit Platform API
+    
+**Simple REST API** for comprehensive web performance and security auditing.
+
+### Available Endpoints
+
+#### 🔍 **POST /audit**
+- **Input**: `{"url": "https://example.com"}`
+- **Output**: Complete audit report with performance, security, and recommendations
+- **Features**: Core Web Vitals, security headers, vulnerability assessment, executive summary
+
+#### ❤️ **GET /health**
+- **Output**: Service health status and component availability
+- **Use**: Monitoring, load balancer health checks
+
+#### 📋 **GET /**
+- **Output**: API information and available endpoints
+- **Use**: Service discovery and API metadata
+
+### Response Structure
+```json
+{
+  "audit_id": "unique-audit-identifier",
+  "url": "https://audited-site.com",
+  "performance": {
+    "core_web_vitals": {"lcp": 2.1, "fid": 45, "cls": 0.05},
+    "lighthouse_score": 85,
+    "overall_grade": "B"
+  },
+  "security": {
+    "https_enabled": true,
+    "risk_level": "low",
+    "vulnerabilities": []
+  },
+  "recommendations": [],
+  "executive_summary": {
+    "business_impact": "Performance optimization needed",
+    "investment_priority": "medium"
+  }
+}
+```
+    """
+
+AUDIT_DESCRIPTION = """Analyze website performance and security with AI-powered insights.
+    
+    **Input**: Single URL to audit
+    **Output**: Complete audit report including:
+    - Core Web Vitals (LCP, FID, CLS)
+    - Lighthouse performance score
+    - Security headers analysis
+    - Vulnerability assessment
+    - Executive business summary
+    - Prioritized recommendations
+    
+    **Example Request**:
+    ```json
+    {"url": "https://example.com"}
+    ```
+    """
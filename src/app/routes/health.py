@@ -5,11 +5,49 @@ Includes root endpoint with API information and health check endpoint for
 monitoring service status and component availability.
 """
 
-from fastapi import APIRouter
-from datetime import datetime
+import time
+import orjson
+from fastapi import APIRouter, Response
 
 router = APIRouter()
 
+# Static response bodies serialized once at import; only the health
+# timestamp changes between requests
+_ROOT_BODY = orjson.dumps({
+    "name": "Web Audit Agent API",
+    "version": "1.0.0",
+    "description": "Simplified web performance & security auditor",
+    "status": "operational",
+    "endpoints": {
+        "health": "/health",
+        "audit": "/audit"
+    }
+})
+_HEALTH_BODY_PREFIX = b'{"status":"healthy","timestamp":"'
+_HEALTH_BODY_SUFFIX = b'","services":' + orjson.dumps({
+    "api": "operational",        # FastAPI service status
+    "mcp_client": "ready",       # Chrome DevTools MCP availability
+    "llm_client": "ready"        # OpenAI LLM client readiness
+}) + b'}'
+
+# Last rendered health timestamp as [epoch_second, iso_bytes]
+_timestamp_cache = [0, b""]
+
+
+def _current_timestamp() -> bytes:
+    """Return the current UTC time as ISO-8601 bytes, cached per second.
+
+    Health checks arrive far more often than once per second from load
+    balancers, so the formatted value is reused until the second changes.
+
+    Returns:
+        bytes: UTC timestamp like b"2024-01-01T12:00:00"
+    """
+    now = int(time.time())
+    if now != _timestamp_cache[0]:
+        _timestamp_cache[:] = [now, time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(now)).encode()]
+    return _timestamp_cache[1]
+
 
 @router.get(
     "/",
@@ -25,18 +63,9 @@ async def root():
     API discovery and basic service identification.
     
     Returns:
-        dict: API metadata including name, version, status, and endpoints
+        Response: JSON API metadata including name, version, status, and endpoints
     """
-    return {
-        "name": "Web Audit Agent API",
-        "version": "1.0.0",
-        "description": "Simplified web performance & security auditor",
-        "status": "operational",
-        "endpoints": {
-            "health": "/health",
-            "audit": "/audit"
-        }
-    }
+    return Response(_ROOT_BODY, media_type="application/json")
 
 
 @router.get(
@@ -53,17 +82,12 @@ async def health_check():
     to verify service availability and readiness.
     
     Returns:
-        dict: Health status with timestamp and component status:
+        Response: JSON health status with timestamp and component status:
             - api: FastAPI service status
             - mcp_client: Chrome DevTools MCP client readiness
             - llm_client: OpenAI LLM client readiness
     """
-    return {
-        "status": "healthy",
-        "timestamp": datetime.utcnow().isoformat(),
-        "services": {
-            "api": "operational",        # FastAPI service status
-            "mcp_client": "ready",       # Chrome DevTools MCP availability
-            "llm_client": "ready"        # OpenAI LLM client readiness
-        }
-    }
\ No newline at end of file
+    return Response(
+        _HEALTH_BODY_PREFIX + _current_timestamp() + _HEALTH_BODY_SUFFIX,
+        media_type="application/json"
+    )
\ No newline at end of file
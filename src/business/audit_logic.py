@@ -8,10 +8,11 @@ to perform comprehensive performance and security analysis.
 from clients.mcp_tool_client import MCPToolClient
 from clients.llm_client import LLMClient
 from schemas.responses import AuditResponse
-from utils.logger import get_logger
+from utils.logger import get_logger, get_metric_logger
 from utils.log_context import log_context
 
 logger = get_logger(__name__)
+metrics_logger = get_metric_logger(__name__)
 
 
 class AuditService:
@@ -64,18 +65,18 @@ class AuditService:
                 )
                 
                 # Log business metrics
-                logger.metric("[audit_completed] url=%s overall_score=%d grade=%s", 
-                             url, audit_result.overall_score, audit_result.grade)
+                metrics_logger.info("[audit_completed] url=%s overall_score=%d grade=%s", 
+                                    url, audit_result.overall_score, audit_result.grade)
                 
-                logger.metric("[core_web_vitals] url=%s LCP=%.2fs FID=%.0fms CLS=%.3f", 
-                             url, audit_result.performance.core_web_vitals.lcp,
-                             audit_result.performance.core_web_vitals.fid,
-                             audit_result.performance.core_web_vitals.cls)
+                metrics_logger.info("[core_web_vitals] url=%s LCP=%.2fs FID=%.0fms CLS=%.3f", 
+                                    url, audit_result.performance.core_web_vitals.lcp,
+                                    audit_result.performance.core_web_vitals.fid,
+                                    audit_result.performance.core_web_vitals.cls)
                 
-                logger.metric("[security_assessment] url=%s https_enabled=%s risk_level=%s vulnerabilities=%d", 
-                             url, audit_result.security.https_enabled,
-                             audit_result.security.risk_level,
-                             len(audit_result.security.vulnerabilities))
+                metrics_logger.info("[security_assessment] url=%s https_enabled=%s risk_level=%s vulnerabilities=%d", 
+                                    url, audit_result.security.https_enabled,
+                                    audit_result.security.risk_level,
+                                    len(audit_result.security.vulnerabilities))
                 
                 logger.info("✓ Audit completed successfully")
                 return audit_result
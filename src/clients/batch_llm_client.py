@@ -0,0 +1,189 @@
+"""OpenAI Batch API client for non-interactive bulk web audits.
+
+This module provides the BatchLLMClient class used for scheduled or bulk
+audits (nightly crawls, regression checks) where latency does not matter.
+Each of the three OpenAI calls is submitted for all URLs at once through the
+Batch API, which is billed at a lower rate and has separate rate limits.
+
+Three-Phase Batch Pipeline:
+Batch 1 (tool selection) → Browser Tools per URL → Batch 2 (analysis) → Batch 3 (summary)
+
+The phases depend on each other's output, so they run as three consecutive
+batches rather than one.
+"""
+
+import asyncio
+import uuid
+from typing import Dict, List, Tuple, Union
+import orjson
+from openai.types.chat import ChatCompletion
+from schemas.responses import AuditResponse, ExecutiveSummary
+from clients.llm_client import LLMClient
+from helpers.exceptions import AuditError
+from config.config import settings
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Batch states after which no further progress is made
+BATCH_FINAL_STATES = {"completed", "failed", "expired", "cancelled"}
+
+
+class BatchLLMClient(LLMClient):
+    """LLM client that runs bulk audits through the OpenAI Batch API.
+
+    Uses the same prompts, tools and structured output schemas as LLMClient,
+    so single audits via analyze_with_mcp_tools keep working unchanged.
+    """
+
+    async def analyze_batch(self, urls: List[str], mcp_client) -> Dict[str, Union[AuditResponse, AuditError]]:
+        """Audit many URLs with batched OpenAI calls.
+
+        Browser tools still run one URL at a time, since every audit drives
+        the same Chrome instance. URLs whose requests fail in any phase are
+        logged and mapped to an AuditError instead of a report.
+
+        Args:
+            urls: Target website URLs to audit
+            mcp_client: MCP client for Chrome DevTools browser automation
+
+        Returns:
+            Dictionary mapping every URL to its AuditResponse, or to an
+            AuditError describing why its audit failed
+
+        Raises:
+            Exception: If a batch cannot be submitted or ends without any output
+        """
+        audits = {str(uuid.uuid4()): url for url in dict.fromkeys(urls)}
+        errors: Dict[str, str] = {}  # Audit ID -> reason the audit failed
+        tools = await self._get_essential_tools(mcp_client)
+
+        # Batch 1: Function Calling - AI selects browser tools for every URL
+        selections, failures = await self._run_batch("tools", {
+            audit_id: self._tool_selection_request(url, tools)
+            for audit_id, url in audits.items()
+        })
+        errors.update(failures)
+
+        # Execute MCP tools sequentially, one URL at a time
+        analysis_requests = {}
+        for audit_id, completion in selections.items():
+            url = audits[audit_id]
+            try:
+                tool_results = await self._execute_tool_calls(
+                    completion.choices[0].message.tool_calls or [], mcp_client
+                )
+            except Exception as e:
+                logger.error("[batch] Tool execution failed for %s: %s", url, str(e))
+                errors[audit_id] = f"Tool execution failed: {e}"
+                continue
+            analysis_requests[audit_id] = self._analysis_request(url, tool_results)
+
+        # Batch 2: Structured Outputs - AI analyzes every URL's tool results
+        analyses, failures = await self._run_batch("analysis", analysis_requests)
+        errors.update(failures)
+        audit_responses = {}
+        for audit_id, completion in analyses.items():
+            message = completion.choices[0].message
+            if message.refusal:
+                logger.warning("[batch] Model refused %s: %s", audits[audit_id], message.refusal)
+                errors[audit_id] = f"Model refused the audit: {message.refusal}"
+                continue
+            audit_responses[audit_id] = AuditResponse.model_validate_json(
+                message.content
+            ).model_copy(update={"audit_id": audit_id})
+
+        # Batch 3: Executive Summary - C-suite summary for every analyzed URL
+        summaries, failures = await self._run_batch("summary", {
+            audit_id: self._executive_summary_request(
+                audit_response.model_dump(exclude={"executive_summary"})
+            )
+            for audit_id, audit_response in audit_responses.items()
+        })
+        errors.update(failures)
+
+        results = {}
+        for audit_id, completion in summaries.items():
+            results[audits[audit_id]] = audit_responses[audit_id].model_copy(update={
+                "executive_summary": ExecutiveSummary.model_validate_json(
+                    completion.choices[0].message.content
+                )
+            })
+
+        logger.info("[batch] ✓ Completed %d of %d audits", len(results), len(audits))
+        for audit_id, url in audits.items():
+            if url not in results:
+                results[url] = AuditError(errors.get(audit_id, "Audit produced no result"))
+        return results
+
+    async def _run_batch(
+        self, phase: str, requests: Dict[str, dict]
+    ) -> Tuple[Dict[str, ChatCompletion], Dict[str, str]]:
+        """Submit one phase's chat completion requests and wait for the batch.
+
+        Failed requests are read from both the batch output file (non-200
+        responses) and its error file. Requests missing from both are
+        reported as failures too.
+
+        Args:
+            phase: Pipeline phase name, used in each request's custom_id
+            requests: Request parameters keyed by audit ID
+
+        Returns:
+            Tuple of (successful completions, failure reasons), both keyed by audit ID
+
+        Raises:
+            Exception: If the batch ends without an output or error file
+        """
+        if not requests:
+            return {}, {}
+
+        lines = b"".join(
+            orjson.dumps({
+                "custom_id": f"{audit_id}:{phase}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": body
+            }) + b"\n"
+            for audit_id, body in requests.items()
+        )
+        batch_file = await self.client.files.create(
+            file=(f"audit-{phase}.jsonl", lines), purpose="batch"
+        )
+        batch = await self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window=settings.llm_batch_completion_window
+        )
+        logger.info("[batch] → Submitted %s batch %s with %d requests", phase, batch.id, len(requests))
+
+        while batch.status not in BATCH_FINAL_STATES:
+            await asyncio.sleep(settings.llm_batch_poll_interval)
+            batch = await self.client.batches.retrieve(batch.id)
+
+        logger.info("[batch] ← %s batch %s finished with status %s", phase, batch.id, batch.status)
+        if not batch.output_file_id and not batch.error_file_id:
+            raise Exception(f"{phase} batch {batch.id} ended with status {batch.status} and no output")
+
+        completions = {}
+        failures = {}
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if not file_id:
+                continue
+            output = await self.client.files.content(file_id)
+            for line in output.content.splitlines():
+                record = orjson.loads(line)
+                audit_id = record["custom_id"].rsplit(":", 1)[0]
+                response = record.get("response")
+                if record.get("error") or not response or response["status_code"] != 200:
+                    reason = record.get("error") or (response and response.get("body")) or response
+                    logger.error("[batch] %s request %s failed: %s", phase, record["custom_id"], reason)
+                    failures[audit_id] = f"{phase} request failed: {reason}"
+                    continue
+                completions[audit_id] = ChatCompletion.model_validate(response["body"])
+
+        for audit_id in requests.keys() - completions.keys() - failures.keys():
+            logger.error("[batch] %s request %s:%s missing from batch %s results",
+                         phase, audit_id, phase, batch.id)
+            failures[audit_id] = f"{phase} request returned no result (batch status {batch.status})"
+        return completions, failures
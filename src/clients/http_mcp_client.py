@@ -7,7 +7,10 @@ proper service separation in a multi-container Docker environment.
 
 import aiohttp
 import asyncio
-from typing import Dict, Any, List
+import logging
+import time
+import orjson
+from typing import Dict, Any, List, Optional
 from config.config import settings
 from utils.logger import get_logger
 
@@ -30,38 +33,74 @@ class HTTPMCPClient:
         """
         self.mcp_service_url = mcp_service_url or settings.mcp_service_url
         self.session = None
+        self._tools_cache: Optional[List[Dict[str, Any]]] = None
+        self._tools_cache_at = 0.0
         self.timeout = aiohttp.ClientTimeout(total=settings.mcp_service_timeout)
         logger.info(f"[http_mcp_client] Initialized with service URL: {self.mcp_service_url}")
     
     async def __aenter__(self):
         """Async context manager entry."""
-        self.session = aiohttp.ClientSession(timeout=self.timeout)
+        self._get_session()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
+        await self.close()
+    
+    async def close(self):
+        """Close the underlying HTTP session if one was opened."""
         if self.session:
             await self.session.close()
+            self.session = None
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use.
+        
+        A single session with a keep-alive connection pool is reused for all
+        tool calls, so TCP connections to the MCP service are not re-opened
+        per request.
+        
+        Returns:
+            aiohttp.ClientSession bound to the pooled connector
+        """
+        if self.session is None:
+            connector = aiohttp.TCPConnector(
+                limit=settings.mcp_service_max_connections,
+                limit_per_host=settings.mcp_service_max_connections,  # Single upstream host
+                keepalive_timeout=settings.mcp_service_keepalive,
+                enable_cleanup_closed=True
+            )
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=self.timeout,
+                json_serialize=lambda obj: orjson.dumps(obj).decode()
+            )
+        return self.session
     
     async def get_available_tools(self) -> List[Dict[str, Any]]:
         """Get available MCP tools from the service.
         
+        The converted tool list is cached for settings.mcp_tools_cache_ttl
+        seconds and dropped when a health check fails.
+        
         Returns:
             List of OpenAI function definitions for available MCP tools
             
         Raises:
             Exception: If service communication fails
         """
-        if not self.session:
-            self.session = aiohttp.ClientSession(timeout=self.timeout)
+        if self._tools_cache and time.monotonic() - self._tools_cache_at < settings.mcp_tools_cache_ttl:
+            return self._tools_cache
+        
+        session = self._get_session()
         
         url = f"{self.mcp_service_url}/mcp/tools"
         
         try:
             logger.info("[http_mcp_client] Fetching available tools from MCP service")
-            async with self.session.get(url) as response:
+            async with session.get(url) as response:
                 if response.status == 200:
-                    data = await response.json()
+                    data = orjson.loads(await response.read())
                     tools = data.get('tools', [])
                     
                     # Convert to OpenAI function calling format
@@ -78,6 +117,8 @@ class HTTPMCPClient:
                         openai_tools.append(openai_tool)
                     
                     logger.info(f"[http_mcp_client] Retrieved {len(openai_tools)} tools from MCP service")
+                    self._tools_cache = openai_tools
+                    self._tools_cache_at = time.monotonic()
                     return openai_tools
                 else:
                     error_text = await response.text()
@@ -101,26 +142,23 @@ class HTTPMCPClient:
         Raises:
             Exception: If tool execution fails
         """
-        if not self.session:
-            self.session = aiohttp.ClientSession(timeout=self.timeout)
+        session = self._get_session()
         
         url = f"{self.mcp_service_url}/mcp/tools/{tool_name}"
         payload = {"arguments": arguments}
         
-        logger.info(f"[http_mcp_client] Executing tool: {tool_name}")
-        logger.debug(f"[http_mcp_client] Tool arguments: {arguments}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[http_mcp_client] Tool %s arguments: %s", tool_name, arguments)
         
         try:
-            import time
-            start_time = time.time()
+            start_time = time.perf_counter()
             
-            async with self.session.post(url, json=payload) as response:
-                duration = time.time() - start_time
-                
+            async with session.post(url, json=payload) as response:
                 if response.status == 200:
-                    result = await response.json()
+                    result = orjson.loads(await response.read())
                     if result.get('success'):
-                        logger.info(f"[http_mcp_client] ✓ Tool {tool_name} completed in {duration:.2f}s")
+                        logger.info("[http_mcp_client] ✓ Tool %s completed in %.3fs",
+                                    tool_name, time.perf_counter() - start_time)
                         return result.get('result', {})
                     else:
                         error_msg = result.get('error', 'Unknown error')
@@ -141,17 +179,19 @@ class HTTPMCPClient:
         Returns:
             True if service is healthy, False otherwise
         """
-        if not self.session:
-            self.session = aiohttp.ClientSession(timeout=self.timeout)
+        session = self._get_session()
         
         url = f"{self.mcp_service_url}/health"
         
         try:
-            async with self.session.get(url) as response:
+            async with session.get(url) as response:
                 if response.status == 200:
-                    data = await response.json()
-                    return data.get('status') == 'healthy'
-                return False
+                    data = orjson.loads(await response.read())
+                    if data.get('status') == 'healthy':
+                        return True
         except Exception as e:
             logger.warning(f"[http_mcp_client] Health check failed: {e}")
-            return False
\ No newline at end of file
+        
+        # Service may have restarted with a different tool set
+        self._tools_cache = None
+        return False
\ No newline at end of file
@@ -12,17 +12,66 @@ OpenAI Call 1 → Browser Tools → OpenAI Call 2 → OpenAI Call 3 → Complete
 3. OpenAI Executive Summary: AI creates C-suite business impact summary
 """
 
-import json
-import uuid
-from datetime import datetime
-from openai import AsyncOpenAI
+import asyncio
+import logging
+import re
+import time
+from collections import OrderedDict
+from typing import Optional
+import httpx
+import orjson
+from openai import AsyncOpenAI, DefaultAioHttpClient
 from schemas.responses import AuditResponse, ExecutiveSummary
-from prompts.prompts import get_audit_analysis_prompt, get_web_audit_expert_prompt, get_structured_audit_prompt, get_executive_summary_prompt
+from prompts.prompts import (
+    get_audit_analysis_prompt, get_audit_analysis_system_prompt, get_web_audit_expert_prompt,
+    get_structured_audit_prompt, get_executive_summary_prompt, get_executive_summary_system_prompt
+)
 from config.config import settings
 from utils.logger import get_logger
+from utils.rate_limiter import estimate_tokens, get_rate_limiter
 
 logger = get_logger(__name__)
 
+# Structured output formats for Calls #2 and #3, generated once from the Pydantic models
+AUDIT_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "audit_response",
+        "strict": True,
+        "schema": AuditResponse.model_json_schema(mode="serialization")
+    }
+}
+EXECUTIVE_SUMMARY_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "executive_summary",
+        "strict": True,
+        "schema": ExecutiveSummary.model_json_schema()
+    }
+}
+
+# Marks the end of the audit fields in streamed Call #2 output; the schema
+# places executive_summary last, so everything before it is Call #3's input
+EXECUTIVE_SUMMARY_KEY = re.compile(r',\s*"executive_summary"\s*:')
+
+
+def create_openai_client(api_key: str) -> AsyncOpenAI:
+    """Create an AsyncOpenAI client with a pooled aiohttp transport.
+
+    Args:
+        api_key: OpenAI API key for authentication
+
+    Returns:
+        AsyncOpenAI: Client owning its own connection pool
+    """
+    # aiohttp transport scales better than httpx's default under concurrent audits
+    return AsyncOpenAI(
+        api_key=api_key,
+        http_client=DefaultAioHttpClient(
+            limits=httpx.Limits(max_connections=settings.llm_max_connections)
+        )
+    )
+
 
 class LLMClient:
     """OpenAI client for AI-powered web audit analysis.
@@ -32,22 +81,30 @@ class LLMClient:
     automation and AI analysis for comprehensive performance and security assessment.
     """
 
-    def __init__(self, api_key: str, model: str = None):
+    def __init__(self, api_key: str = None, model: str = None, client: Optional[AsyncOpenAI] = None):
         """Initialize the OpenAI client.
 
         Args:
-            api_key: OpenAI API key for authentication
+            api_key: OpenAI API key for authentication (unused when client is given)
             model: GPT model to use (defaults to config setting)
+            client: Pre-built AsyncOpenAI client to share its connection pool
         """
-        self.client = AsyncOpenAI(api_key=api_key)
+        self.client = client or create_openai_client(api_key)
         self.model = model or settings.openai_model  # Use config default if not specified
-        logger.info(f"[llm_client] Initialized with model: {self.model}")
-        logger.info(f"[llm_client] Using OpenAI Structured Outputs with Pydantic schema")
+        self._audit_cache: OrderedDict = OrderedDict()  # (url, model) -> (stored_at, frozen AuditResponse)
+        self._essential_tools: list = []  # Filtered OpenAI tool definitions
+        self._essential_tools_source: Optional[list] = None  # MCP tool list they were filtered from
+        logger.info("[llm_client] Initialized with model: %s (Structured Outputs)", self.model)
+
+    async def close(self):
+        """Close the underlying OpenAI HTTP connection pool."""
+        await self.client.close()
 
     async def analyze_with_mcp_tools(self, url: str, mcp_client) -> AuditResponse:
         """Perform AI-powered web audit using MCP tools.
 
         Coordinates between OpenAI GPT model and Chrome DevTools MCP tools:
+        0. Returns a recent cached audit of the same URL if one exists
         1. Gets available MCP tools for browser automation
         2. Uses OpenAI function calling to determine which tools to use
         3. Executes browser automation via MCP client
@@ -65,130 +122,381 @@ class LLMClient:
         Raises:
             Exception: If OpenAI API calls or MCP tool execution fails
         """
+        # Skip all three OpenAI calls and browser automation on a recent repeat audit
+        cached = self._get_cached_audit(url)
+        if cached is not None:
+            logger.info("[audit_cache] ✓ Returning cached audit for %s", url)
+            return cached
+
         # Get filtered MCP tools to reduce OpenAI function calling complexity
         tools = await self._get_essential_tools(mcp_client)
 
-        # Use expert system prompts for specialized web audit analysis
-        system_prompt = get_web_audit_expert_prompt()
-        user_prompt = get_structured_audit_prompt(url)
-
         # OpenAI Call #1: Function Calling - AI selects browser tools to execute
-        logger.info(f"[llm_call_1] → Starting OpenAI Call #1 (Function Calling) for {url}")
-        response = await self.client.chat.completions.create(
-            model=self.model,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ],
-            tools=tools,
-            tool_choice=settings.llm_tool_choice,  # Configurable tool selection strategy
-            temperature=settings.llm_temperature  # Configurable randomness control
-        )
-        logger.info(f"[llm_call_1] ← Completed OpenAI Call #1 - Selected {len(response.choices[0].message.tool_calls or [])} tools")
+        logger.info("[llm_call_1] → Starting OpenAI Call #1 (Function Calling) for %s", url)
+        response = await self._create_completion(**self._tool_selection_request(url, tools))
+        logger.info("[llm_call_1] ← Completed OpenAI Call #1 - Selected %d tools",
+                    len(response.choices[0].message.tool_calls or []))
 
         # Execute MCP tools based on OpenAI function calling decisions
-        tool_results = {}
-        if response.choices[0].message.tool_calls:
-            for tool_call in response.choices[0].message.tool_calls:
-                tool_name = tool_call.function.name
-                tool_args = json.loads(tool_call.function.arguments)
-                result = await mcp_client.call_tool(tool_name, tool_args)
-                tool_results[tool_name] = result
-
-        # OpenAI Call #2: Structured Outputs - AI analyzes data and generates audit report
-        analysis_prompt = get_audit_analysis_prompt(url, tool_results)
-        logger.info(f"[llm_call_2] → Starting OpenAI Call #2 (Structured Analysis) for {url}")
-        logger.info(f"[structured_outputs] Starting Pydantic structured analysis for {url}")
-
-        # Generate schema directly from Pydantic model
-        schema = AuditResponse.model_json_schema()
-        logger.info(f"[structured_outputs] Generated schema with {len(schema['properties'])} properties")
-
-        final_response = await self.client.chat.completions.create(
-            model=self.model,
-            messages=[{"role": "user", "content": analysis_prompt}],
-            response_format={
-                "type": "json_schema",
-                "json_schema": {
-                    "name": "audit_response",
-                    "strict": True,
-                    "schema": schema
-                }
-            },
-            temperature=settings.llm_temperature
+        tool_results = await self._execute_tool_calls(
+            response.choices[0].message.tool_calls or [], mcp_client
         )
-        logger.info(f"[llm_call_2] ← Completed OpenAI Call #2 - Generated structured audit report")
+
+        # OpenAI Call #2: Structured Outputs - AI analyzes data and generates audit report.
+        # The response is streamed so Call #3 can start before Call #2 finishes.
+        logger.info("[llm_call_2] → Starting OpenAI Call #2 (Structured Analysis) for %s", url)
+
+        content, executive_task = await self._stream_audit_analysis(url, tool_results)
+        logger.info("[llm_call_2] ← Completed OpenAI Call #2 - Generated structured audit report (%d chars)",
+                    len(content))
+
+        try:
+            # Parse and validate in one pass; audit_id/timestamp defaults cover any gaps
+            audit_response = AuditResponse.model_validate_json(content)
+
+            # OpenAI Call #3: Executive Summary - started early while streaming when possible
+            if executive_task is None:
+                executive_task = asyncio.create_task(
+                    self._generate_executive_summary(url, audit_response.model_dump())
+                )
+            audit_response = audit_response.model_copy(
+                update={"executive_summary": await executive_task}
+            )
+        except BaseException:
+            if executive_task is not None:
+                executive_task.cancel()
+            raise
+
+        logger.info("[executive_summary] ✓ Complete audit with executive summary - Score: %d",
+                    audit_response.overall_score)
+        self._cache_audit(url, audit_response)
+        return audit_response
+
+    async def _stream_audit_analysis(self, url: str, tool_results: dict) -> tuple:
+        """Stream OpenAI Call #2 and start Call #3 once its inputs are complete.
+
+        Structured Outputs emit keys in schema order, with executive_summary
+        last. When that key appears, everything Call #3 summarises has been
+        received, so the executive summary is requested from the parsed prefix
+        while the rest of Call #2 is still streaming.
+
+        Args:
+            url: Target website URL being audited
+            tool_results: MCP tool results keyed by tool name
+
+        Returns:
+            Tuple of (complete Call #2 JSON content, Call #3 task or None if
+            the prefix never became parseable)
+
+        Raises:
+            Exception: If the model refuses the request
+        """
+        stream = await self._create_completion(
+            stream=True,
+            stream_options={"include_usage": True},  # Final chunk reports usage for the rate limiter
+            **self._analysis_request(url, tool_results)
+        )
+
+        content = ""
+        refusal = ""
+        scan_from = 0
+        executive_task = None
+        try:
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta
+                if getattr(delta, "refusal", None):
+                    refusal += delta.refusal
+                if not delta.content:
+                    continue
+                content += delta.content
+
+                if executive_task is not None:
+                    continue
+                match = EXECUTIVE_SUMMARY_KEY.search(content, scan_from)
+                while match is not None:
+                    try:
+                        audit_data = orjson.loads(content[:match.start()] + "}")
+                    except orjson.JSONDecodeError:
+                        # Key text inside a string value; keep looking
+                        match = EXECUTIVE_SUMMARY_KEY.search(content, match.end())
+                        continue
+                    logger.info("[llm_call_2] Audit fields complete - starting Call #3 while streaming")
+                    executive_task = asyncio.create_task(
+                        self._generate_executive_summary(url, audit_data)
+                    )
+                    break
+                else:
+                    # Allow for a key split across chunks
+                    scan_from = max(0, len(content) - 32)
+        except BaseException:
+            if executive_task is not None:
+                executive_task.cancel()
+            raise
 
         # Handle refusal detection
-        if hasattr(final_response.choices[0].message, 'refusal') and final_response.choices[0].message.refusal:
-            logger.warning(f"[structured_outputs] Model refused: {final_response.choices[0].message.refusal}")
-            raise Exception(f"Model refused request: {final_response.choices[0].message.refusal}")
-
-        # Parse and validate with Pydantic
-        content = final_response.choices[0].message.content
-        logger.debug(f"[structured_outputs] Response length: {len(content)} chars")
-
-        result_json = json.loads(content)
-
-        # Add required fields if missing (schema should prevent this)
-        if "audit_id" not in result_json:
-            result_json["audit_id"] = str(uuid.uuid4())
-        if "timestamp" not in result_json:
-            result_json["timestamp"] = datetime.utcnow().isoformat()
-
-        # OpenAI Call #3: Executive Summary - Generate C-suite business summary
-        executive_prompt = get_executive_summary_prompt(result_json)
-        logger.info(f"[llm_call_3] → Starting OpenAI Call #3 (Executive Summary) for {url}")
-        logger.info(f"[executive_summary] Generating C-suite summary for {url}")
-        
-        executive_schema = ExecutiveSummary.model_json_schema()
-        
-        executive_response = await self.client.chat.completions.create(
-            model=self.model,
-            messages=[{"role": "user", "content": executive_prompt}],
-            response_format={
-                "type": "json_schema",
-                "json_schema": {
-                    "name": "executive_summary",
-                    "strict": True,
-                    "schema": executive_schema
-                }
-            },
-            temperature=0.3  # Lower temperature for executive consistency
+        if refusal:
+            if executive_task is not None:
+                executive_task.cancel()
+            logger.warning("[structured_outputs] Model refused: %s", refusal)
+            raise Exception(f"Model refused request: {refusal}")
+
+        return content, executive_task
+
+    async def _generate_executive_summary(self, url: str, audit_data: dict) -> ExecutiveSummary:
+        """Run OpenAI Call #3 to produce the C-suite executive summary.
+
+        Args:
+            url: Target website URL being audited
+            audit_data: Audit findings to summarise
+
+        Returns:
+            ExecutiveSummary: Validated business impact summary
+        """
+        logger.info("[llm_call_3] → Starting OpenAI Call #3 (Executive Summary) for %s", url)
+
+        executive_response = await self._create_completion(**self._executive_summary_request(audit_data))
+
+        executive_summary = ExecutiveSummary.model_validate_json(
+            executive_response.choices[0].message.content
         )
-        
-        executive_content = executive_response.choices[0].message.content
-        executive_json = json.loads(executive_content)
-        
-        # LOG THE THIRD CALL OUTPUT
-        logger.info(f"[llm_call_3] ← Completed OpenAI Call #3 - Executive Summary Generated")
-        logger.info(f"[llm_call_3] Executive Summary Output: {executive_json}")
-        
-        result_json["executive_summary"] = executive_json
-        
-        # DEBUG: Log the complete result_json before creating AuditResponse
-        logger.info(f"[debug] Complete result_json keys: {list(result_json.keys())}")
-        logger.info(f"[debug] Executive summary in result_json: {result_json.get('executive_summary')}")
-        
-        audit_response = AuditResponse(**result_json)
-        
-        # DEBUG: Log the final audit_response to see if executive_summary is preserved
-        logger.info(f"[debug] Final audit_response has executive_summary: {hasattr(audit_response, 'executive_summary')}")
-        if hasattr(audit_response, 'executive_summary'):
-            logger.info(f"[debug] Final executive_summary content: {audit_response.executive_summary}")
-        
-        logger.info(f"[executive_summary] ✓ Complete audit with executive summary - Score: {audit_response.overall_score}")
+        logger.info("[llm_call_3] ← Completed OpenAI Call #3 - Executive Summary Generated")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[llm_call_3] Executive Summary Output: %s", executive_summary)
+        return executive_summary
+
+    async def _create_completion(self, **request):
+        """Call chat.completions.create within the model's configured rate limits.
+
+        Waits for room in the model's RPM/TPM budgets using an estimate of
+        the prompt size, then corrects the token budget with the usage the
+        API reports (from the final chunk for streamed responses).
+
+        Args:
+            **request: chat.completions.create parameters, including model
+
+        Returns:
+            ChatCompletion, or an async iterator of chunks when streaming
+        """
+        limiter = get_rate_limiter(request["model"])
+        if limiter is None:
+            return await self.client.chat.completions.create(**request)
+
+        estimated = estimate_tokens(orjson.dumps([request["messages"], request.get("tools")]))
+        await limiter.acquire(estimated)
+        response = await self.client.chat.completions.create(**request)
+
+        if request.get("stream"):
+            return self._record_stream_usage(response, limiter, estimated)
+        if response.usage:
+            limiter.record_usage(estimated, response.usage.total_tokens)
+        return response
+
+    @staticmethod
+    async def _record_stream_usage(stream, limiter, estimated: int):
+        """Pass streamed chunks through, recording the usage chunk with the limiter."""
+        async for chunk in stream:
+            usage = getattr(chunk, "usage", None)
+            if usage:
+                limiter.record_usage(estimated, usage.total_tokens)
+            yield chunk
+
+    # Request bodies for the three OpenAI calls. Every call sends static
+    # instructions first and audit-specific data last, so the shared prefix
+    # is eligible for OpenAI's automatic prompt caching.
+
+    def _tool_selection_request(self, url: str, tools: list) -> dict:
+        """Build the Call #1 (function calling) request parameters."""
+        return {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": get_web_audit_expert_prompt()},
+                {"role": "user", "content": get_structured_audit_prompt(url)}
+            ],
+            "tools": tools,
+            "tool_choice": settings.llm_tool_choice,  # Configurable tool selection strategy
+            "temperature": settings.llm_temperature,  # Configurable randomness control
+            "prompt_cache_key": "web-audit-tool-selection"  # Route to servers holding the static prefix
+        }
+
+    def _analysis_request(self, url: str, tool_results: dict) -> dict:
+        """Build the Call #2 (structured audit analysis) request parameters."""
+        return {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": get_audit_analysis_system_prompt()},
+                {"role": "user", "content": get_audit_analysis_prompt(url, self._compact_tool_results(tool_results))}
+            ],
+            "response_format": AUDIT_RESPONSE_FORMAT,
+            "temperature": settings.llm_temperature,
+            "prompt_cache_key": "web-audit-analysis"
+        }
+
+    def _executive_summary_request(self, audit_data: dict) -> dict:
+        """Build the Call #3 (executive summary) request parameters."""
+        return {
+            # Summarising already-structured findings does not need the audit model
+            "model": settings.openai_summary_model,
+            "messages": [
+                {"role": "system", "content": get_executive_summary_system_prompt()},
+                {"role": "user", "content": get_executive_summary_prompt(audit_data)}
+            ],
+            "response_format": EXECUTIVE_SUMMARY_FORMAT,
+            "temperature": 0.3,  # Lower temperature for executive consistency
+            "prompt_cache_key": "web-audit-executive-summary"
+        }
+
+    def _compact_tool_results(self, tool_results: dict) -> dict:
+        """Shrink raw MCP tool output before it is embedded in the Call #2 prompt.
+
+        Screenshots and other inline images are reduced to their size, long
+        lists keep only their last settings.tool_result_max_items entries and
+        long strings are cut at settings.tool_result_max_chars.
+
+        Args:
+            tool_results: Raw MCP tool results keyed by tool name
+
+        Returns:
+            Compacted copy of the tool results
+        """
+        max_chars = settings.tool_result_max_chars
+        max_items = settings.tool_result_max_items
+
+        def compact(value):
+            if isinstance(value, dict):
+                if value.get("type") == "image" and isinstance(value.get("data"), str):
+                    return {"type": "image", "mimeType": value.get("mimeType"), "bytes": len(value["data"])}
+                return {key: compact(item) for key, item in value.items()}
+            if isinstance(value, list):
+                if len(value) > max_items:
+                    dropped = len(value) - max_items
+                    return [f"[...{dropped} earlier items omitted]"] + [compact(item) for item in value[-max_items:]]
+                return [compact(item) for item in value]
+            if isinstance(value, str):
+                if value.startswith("data:image/"):
+                    return f"[inline image, {len(value)} bytes]"
+                if len(value) > max_chars:
+                    return f"{value[:max_chars]}[...truncated {len(value) - max_chars} chars]"
+            return value
+
+        compacted = compact(tool_results)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[tool_results] Compacted %d chars to %d chars for analysis",
+                         len(str(tool_results)), len(str(compacted)))
+        return compacted
+
+    def _get_cached_audit(self, url: str) -> Optional[AuditResponse]:
+        """Return a cached audit for the URL if it is still within the TTL.
+
+        Args:
+            url: Target website URL
+
+        Returns:
+            Cached AuditResponse (frozen, so safe to share), or None on a miss
+        """
+        if settings.audit_cache_ttl <= 0:
+            return None
+
+        key = (url, self.model)
+        entry = self._audit_cache.get(key)
+        if entry is None:
+            return None
+
+        stored_at, audit_response = entry
+        if time.monotonic() - stored_at > settings.audit_cache_ttl:
+            del self._audit_cache[key]
+            return None
+
+        self._audit_cache.move_to_end(key)
         return audit_response
 
-    async def _get_essential_tools(self, mcp_client) -> list:
-        """Return only essential audit tools to reduce choice complexity"""
-        all_tools = await mcp_client.get_available_tools()
+    def _cache_audit(self, url: str, audit_response: AuditResponse) -> None:
+        """Store a completed audit, evicting the least recently used entries.
 
-        # Use configurable essential tools list
-        essential_tool_names = set(settings.essential_tools)  # Convert to set for faster lookup
+        Args:
+            url: Target website URL
+            audit_response: Completed audit to cache
+        """
+        if settings.audit_cache_ttl <= 0:
+            return
+
+        key = (url, self.model)
+        self._audit_cache[key] = (time.monotonic(), audit_response)
+        self._audit_cache.move_to_end(key)
+        while len(self._audit_cache) > settings.audit_cache_size:
+            self._audit_cache.popitem(last=False)
+
+    async def _execute_tool_calls(self, tool_calls: list, mcp_client) -> dict:
+        """Execute LLM-selected MCP tools, overlapping independent calls.
+
+        Tools listed in settings.stateful_tools (navigation, tracing, network
+        emulation) act as ordering barriers and run one at a time. Runs of
+        read-only tools between them are awaited together with asyncio.gather,
+        at most settings.mcp_max_concurrency at once. Duplicate read-only calls
+        with identical arguments in the same run execute only once. A failing
+        read-only tool is recorded as an error result instead of aborting its
+        siblings.
 
-        return [tool for tool in all_tools
-                if tool["function"]["name"] in essential_tool_names]
+        Args:
+            tool_calls: Tool calls from the OpenAI function calling response
+            mcp_client: MCP client for Chrome DevTools browser automation
 
+        Returns:
+            Dictionary mapping tool name to its result (last call wins)
+        """
+        stateful_tools = settings.stateful_tools
+        semaphore = asyncio.Semaphore(settings.mcp_max_concurrency)
+        tool_results = {}
+        pending = []
+
+        async def call_bounded(name: str, args: dict):
+            async with semaphore:
+                return await mcp_client.call_tool(name, args)
+
+        async def flush():
+            # Identical calls between two barriers see the same page state, so run each once
+            keys = [(name, orjson.dumps(args, option=orjson.OPT_SORT_KEYS)) for name, args in pending]
+            unique = dict(zip(keys, pending))
+            results = await asyncio.gather(
+                *(call_bounded(name, args) for name, args in unique.values()),
+                return_exceptions=True
+            )
+            results_by_key = {}
+            for (name, args_key), result in zip(unique, results):
+                if isinstance(result, Exception):
+                    logger.error("[tool=%s] Tool execution failed: %s", name, str(result))
+                    result = {"error": str(result), "tool": name}
+                results_by_key[(name, args_key)] = result
+            for key in keys:
+                tool_results[key[0]] = results_by_key[key]
+            pending.clear()
+
+        for tool_call in tool_calls:
+            tool_name = tool_call.function.name
+            tool_args = orjson.loads(tool_call.function.arguments)
+            if tool_name in stateful_tools:
+                await flush()
+                tool_results[tool_name] = await mcp_client.call_tool(tool_name, tool_args)
+            else:
+                pending.append((tool_name, tool_args))
+        await flush()
+
+        return tool_results
+
+    async def _get_essential_tools(self, mcp_client) -> list:
+        """Return only essential audit tools to reduce choice complexity.
+
+        Both MCP clients return the same cached list object until their tool
+        cache is refreshed, so the filtered list is reused for as long as that
+        object is unchanged.
+        """
+        all_tools = await mcp_client.get_available_tools()
 
+        if self._essential_tools_source is not all_tools:
+            # Use configurable essential tools set (frozenset for O(1) lookup)
+            self._essential_tools = [tool for tool in all_tools
+                                     if tool["function"]["name"] in settings.essential_tools]
+            self._essential_tools_source = all_tools
 
+        return self._essential_tools
@@ -6,14 +6,29 @@ It manages the Node.js MCP server process and provides JSON-RPC communication.
 """
 
 import asyncio
-import json
-import subprocess
-from typing import Optional
+import itertools
+import logging
+import os
+import tempfile
+import orjson
+from functools import lru_cache
+from pathlib import Path
+from time import perf_counter
+from typing import Dict, Optional
 from config.config import settings
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Per-line read limit for MCP responses; screenshots and traces far exceed the 64 KiB default
+STREAM_LIMIT = 64 * 1024 * 1024
+
+
+@lru_cache(maxsize=None)
+def _envelope_prefix(method: str) -> bytes:
+    """Return the pre-encoded JSON-RPC envelope up to the request ID for a method."""
+    return b'{"jsonrpc":"2.0","method":' + orjson.dumps(method) + b',"id":'
+
 
 class MCPToolClient:
     """Chrome DevTools MCP client for browser automation.
@@ -32,9 +47,14 @@ class MCPToolClient:
 
     def __init__(self):
         """Initialize MCP client with connection state tracking."""
-        self.process: Optional[subprocess.Popen] = None
+        self.process: Optional[asyncio.subprocess.Process] = None
         self.connected = False
         self._tools_cache: Optional[list] = None
+        self._tools_cache_key: Optional[str] = None  # MCP package and server version the cache belongs to
+        self._request_ids = itertools.count(1)  # Unique JSON-RPC ID per request
+        self._pending: Dict[int, asyncio.Future] = {}  # Request ID -> awaiting caller
+        self._reader_task: Optional[asyncio.Task] = None
+        self._connect_lock = asyncio.Lock()
 
     async def get_available_tools(self) -> list:
         """Get available MCP tools formatted for OpenAI function calling.
@@ -51,11 +71,13 @@ class MCPToolClient:
         if self._tools_cache:
             return self._tools_cache
 
-        if not self.connected:
-            await self._connect()
+        # Connecting may restore the list persisted for this server version
+        await self._ensure_connected()
 
-        mcp_tools = await self._get_mcp_tools()
-        self._tools_cache = [self._transform_mcp_tool_to_openai(tool) for tool in mcp_tools]
+        if self._tools_cache is None:
+            mcp_tools = await self._get_mcp_tools()
+            self._tools_cache = [self._transform_mcp_tool_to_openai(tool) for tool in mcp_tools]
+            self._persist_tools()
         return self._tools_cache
 
     async def call_tool(self, tool_name: str, arguments: dict) -> dict:
@@ -74,27 +96,60 @@ class MCPToolClient:
         Raises:
             Exception: If MCP server communication fails
         """
-        if not self.connected:
-            await self._connect()
+        await self._ensure_connected()
 
-        logger.info("[tool=%s] Tool execution started", tool_name)
-        logger.debug("[tool=%s] Arguments: %s", tool_name, arguments)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[tool=%s] Arguments: %s", tool_name, arguments)
 
         # Use tool name directly (no mapping needed with dynamic discovery)
         mcp_tool_name = tool_name
 
         try:
-            import time
-            start_time = time.time()
+            start_time = perf_counter()
             result = await self._call_mcp_tool(mcp_tool_name, arguments)
-            duration = time.time() - start_time
-
-            logger.info("[tool=%s] ✓ Tool completed in %.2fs", tool_name, duration)
+            logger.info("[tool=%s] ✓ Tool completed in %.3fs", tool_name, perf_counter() - start_time)
             return result
         except Exception as e:
             logger.error("[mcp_client] Tool execution failed: %s (tool=%s)", str(e), tool_name)
             return {"error": str(e), "tool": tool_name}
 
+    async def close(self):
+        """Stop the MCP server subprocess and reset connection state.
+
+        Called on application shutdown so the Node.js server (and the Chrome
+        instance it owns) is not left running.
+        """
+        await self._stop_process()
+        self._tools_cache = None
+        self._tools_cache_key = None
+
+    async def _ensure_connected(self):
+        """Connect to the MCP server once, even when called concurrently."""
+        if self.connected:
+            return
+        async with self._connect_lock:
+            if not self.connected:
+                await self._connect()
+
+    async def _stop_process(self):
+        """Terminate the MCP server subprocess and stop reading its output."""
+        self.connected = False
+        if self._reader_task:
+            self._reader_task.cancel()
+            self._reader_task = None
+        if self.process:
+            process, self.process = self.process, None
+            try:
+                process.terminate()
+                try:
+                    await asyncio.wait_for(process.wait(), timeout=settings.mcp_shutdown_timeout)
+                except asyncio.TimeoutError:
+                    logger.warning("[mcp_client] MCP server ignored SIGTERM, killing it")
+                    process.kill()
+                    await process.wait()
+            except ProcessLookupError:
+                pass  # Already exited
+
     async def _connect(self):
         """Establish connection to Chrome DevTools MCP server.
 
@@ -104,6 +159,9 @@ class MCPToolClient:
         Raises:
             Exception: If subprocess startup or MCP initialization fails
         """
+        # Reap a previous server that exited on its own
+        await self._stop_process()
+
         try:
             # Start Node.js MCP server subprocess with Chrome DevTools integration
             mcp_args = [
@@ -112,41 +170,78 @@ class MCPToolClient:
                 f'--isolated={str(settings.mcp_isolated).lower()}'
             ]
 
-            self.process = subprocess.Popen(
-                mcp_args,
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
+            self.process = await asyncio.create_subprocess_exec(
+                *mcp_args,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,  # Never read; a full pipe would stall the server
+                limit=STREAM_LIMIT
             )
+            self._reader_task = asyncio.create_task(self._read_responses(self.process))
 
             # Allow MCP server time to initialize Chrome browser connection
             await asyncio.sleep(settings.mcp_startup_timeout)
 
             # Send MCP protocol initialization handshake
-            await self._send_request({
-                "jsonrpc": "2.0",
-                "id": settings.mcp_init_id,
-                "method": "initialize",
-                "params": {
-                    "protocolVersion": settings.mcp_protocol_version,
-                    "capabilities": {},
-                    "clientInfo": {
-                        "name": settings.mcp_client_name,
-                        "version": settings.mcp_client_version
-                    }
+            init_result = await self._send_request("initialize", {
+                "protocolVersion": settings.mcp_protocol_version,
+                "capabilities": {},
+                "clientInfo": {
+                    "name": settings.mcp_client_name,
+                    "version": settings.mcp_client_version
                 }
             })
 
             self.connected = True
-            self._tools_cache = None  # Reset cache on new connection
+
+            # The tool list only changes with the server version, so a reconnect
+            # to the same version keeps it and a new version reloads from disk
+            server_version = (init_result.get("serverInfo") or {}).get("version")
+            cache_key = f"{settings.mcp_package}|{server_version}"
+            if cache_key != self._tools_cache_key:
+                self._tools_cache_key = cache_key
+                self._tools_cache = self._load_persisted_tools()
 
         except Exception as e:
-            if self.process:
-                self.process.terminate()
-                self.process = None
+            await self._stop_process()
             raise Exception(f"Failed to connect to MCP: {e}")
 
+    def _load_persisted_tools(self) -> Optional[list]:
+        """Load the tool list saved on disk for the connected server version.
+
+        Returns:
+            OpenAI-formatted tool list, or None if missing or for another version
+        """
+        try:
+            data = orjson.loads(Path(settings.tools_cache_path).read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            return None
+        if not isinstance(data, dict) or data.get("key") != self._tools_cache_key:
+            return None
+        logger.info("[mcp_client] Loaded %d tools from %s", len(data["tools"]), settings.tools_cache_path)
+        return data["tools"]
+
+    def _persist_tools(self):
+        """Save the OpenAI-formatted tool list so the next process can skip tools/list."""
+        path = Path(settings.tools_cache_path)
+        tmp_name = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Unique temp file per writer, so concurrent workers never share one
+            with tempfile.NamedTemporaryFile(
+                dir=path.parent, prefix=f"{path.name}.", suffix=".tmp", delete=False
+            ) as tmp_file:
+                tmp_name = tmp_file.name
+                tmp_file.write(orjson.dumps({"key": self._tools_cache_key, "tools": self._tools_cache}))
+            os.replace(tmp_name, path)  # Atomic, so readers never see a partial file
+        except OSError as e:
+            logger.warning("[mcp_client] Could not persist tools cache: %s", str(e))
+            if tmp_name:
+                try:
+                    os.unlink(tmp_name)
+                except OSError:
+                    pass
+
     async def _call_mcp_tool(self, tool_name: str, arguments: dict) -> dict:
         """Execute MCP tool via JSON-RPC protocol.
 
@@ -157,61 +252,89 @@ class MCPToolClient:
         Returns:
             Tool execution result from MCP server
         """
-        request = {
-            "jsonrpc": "2.0",
-            "id": settings.mcp_call_id,  # Configurable JSON-RPC ID
-            "method": "tools/call",
-            "params": {
-                "name": tool_name,
-                "arguments": arguments
-            }
-        }
+        return await self._send_request("tools/call", {
+            "name": tool_name,
+            "arguments": arguments
+        })
 
-        return await self._send_request(request)
-
-    async def _send_request(self, request: dict) -> dict:
+    async def _send_request(self, method: str, params: dict) -> dict:
         """Send JSON-RPC request to MCP server subprocess.
 
+        Assigns a unique request ID and waits for the matching response,
+        so several requests can be in flight on the same pipe.
+
         Args:
-            request: JSON-RPC request dictionary
+            method: JSON-RPC method name (e.g., 'tools/call')
+            params: JSON-RPC request parameters
 
         Returns:
             JSON-RPC response result
 
         Raises:
-            Exception: If subprocess communication fails or returns error
+            Exception: If subprocess communication fails, times out, or returns error
         """
         if not self.process:
             raise Exception("MCP process not started")
 
-        request_str = json.dumps(request) + '\n'
-        self.process.stdin.write(request_str)
-        self.process.stdin.flush()
-
-        response_str = self.process.stdout.readline()
-        if not response_str:
-            raise Exception("No response from MCP server")
-
-        response = json.loads(response_str.strip())
+        request_id = next(self._request_ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        try:
+            # Pipes are binary: only the ID and params are encoded per request
+            self.process.stdin.write(
+                _envelope_prefix(method) + str(request_id).encode() +
+                b',"params":' + orjson.dumps(params) + b'}\n'
+            )
+            await self.process.stdin.drain()
+            response = await asyncio.wait_for(future, timeout=settings.mcp_request_timeout)
+        except asyncio.TimeoutError:
+            raise Exception(f"MCP request timed out after {settings.mcp_request_timeout}s")
+        finally:
+            self._pending.pop(request_id, None)
 
         if 'error' in response:
             raise Exception(f"MCP error: {response['error']}")
 
         return response.get('result', {})
 
+    async def _read_responses(self, process: asyncio.subprocess.Process):
+        """Route JSON-RPC responses from the server to their waiting requests.
+
+        Runs as a background task for the lifetime of the subprocess. When the
+        server exits, all outstanding requests fail instead of hanging.
+
+        Args:
+            process: MCP server subprocess whose stdout is read
+        """
+        try:
+            while True:
+                line = await process.stdout.readline()
+                if not line:
+                    break
+                try:
+                    response = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    logger.debug("[mcp_client] Ignoring non-JSON output: %r", line[:200])
+                    continue
+                future = self._pending.get(response.get('id')) if isinstance(response, dict) else None
+                if future is not None and not future.done():
+                    future.set_result(response)
+        except Exception as e:
+            logger.error("[mcp_client] Response reader failed: %s", str(e))
+        finally:
+            if self.process is process:
+                self.connected = False
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(Exception("No response from MCP server"))
+
     async def _get_mcp_tools(self) -> list:
         """Retrieve available tools from MCP server.
 
         Returns:
             List of MCP tool definitions from server
         """
-        request = {
-            "jsonrpc": "2.0",
-            "id": settings.mcp_list_id,  # Configurable JSON-RPC ID
-            "method": "tools/list",
-            "params": {}
-        }
-        response = await self._send_request(request)
+        response = await self._send_request("tools/list", {})
         return response.get('tools', [])
 
     def _transform_mcp_tool_to_openai(self, mcp_tool: dict) -> dict:
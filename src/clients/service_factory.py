@@ -5,62 +5,105 @@ instances with proper dependency injection. It centralizes service creation
 and ensures consistent configuration across the application.
 """
 
-import os
+from functools import lru_cache
+from fastapi import Request
+from openai import AsyncOpenAI
 from config.config import settings
 from clients.mcp_tool_client import MCPToolClient
 from clients.http_mcp_client import HTTPMCPClient
-from clients.llm_client import LLMClient
+from clients.llm_client import LLMClient, create_openai_client
+from clients.batch_llm_client import BatchLLMClient
 from business.audit_logic import AuditService
 
+# Multi-container Docker setup: the API reaches Chrome through the chrome-mcp service.
+# Requires ENVIRONMENT=development explicitly, so an unset environment means stdio
+_IS_DOCKER = settings.environment == 'development' and 'chrome-mcp' in settings.mcp_service_url
 
+# Transport resolved once at import; "auto" picks HTTP only in the Docker setup
+_MCP_TRANSPORT = (
+    ("http" if _IS_DOCKER else "stdio")
+    if settings.mcp_transport == "auto" else settings.mcp_transport
+)
+
+
+@lru_cache(maxsize=1)
 def get_mcp_client():
-    """Create appropriate MCP client based on environment.
+    """Create appropriate MCP client based on configuration.
     
-    Factory function that detects the deployment environment and returns
-    the appropriate MCP client:
-    - HTTPMCPClient for Docker/containerized environments
-    - MCPToolClient for local development
+    Factory function that selects the MCP transport from settings.mcp_transport:
+    - "http": HTTPMCPClient against the long-lived Chrome MCP service, which
+      keeps Chrome running and pools keep-alive connections across audits
+    - "stdio": MCPToolClient spawning a local MCP subprocess (development fallback)
+    - "auto": HTTP in the Docker development setup, stdio otherwise
+    
+    Cached, so the process shares one client; closing it is safe because
+    both clients reconnect lazily on next use.
     
     Returns:
         MCP client instance (HTTPMCPClient or MCPToolClient)
     """
-    # Check if running in Docker environment
-    is_docker = os.getenv('ENVIRONMENT') == 'development' and 'chrome-mcp' in settings.mcp_service_url
-    
-    if is_docker:
-        # Use HTTP client for multi-container Docker setup
+    if _MCP_TRANSPORT == "http":
+        # Use HTTP client for the shared multi-container MCP service
         return HTTPMCPClient(settings.mcp_service_url)
     else:
         # Use subprocess client for local development
         return MCPToolClient()
 
 
-def get_llm_client() -> LLMClient:
+@lru_cache(maxsize=1)
+def _shared_openai() -> AsyncOpenAI:
+    """Return the process-wide OpenAI client.
+    
+    Every LLMClient shares this instance, so TCP/TLS connections to the
+    OpenAI API are pooled once per process instead of once per client.
+    
+    Returns:
+        AsyncOpenAI: Shared OpenAI client
+    """
+    return create_openai_client(settings.openai_api_key)
+
+
+async def close_shared_openai():
+    """Close the shared OpenAI client's connection pool if it was created."""
+    if _shared_openai.cache_info().currsize:
+        await _shared_openai().close()
+        _shared_openai.cache_clear()
+        get_llm_client.cache_clear()  # Cached clients hold the closed instance
+
+
+@lru_cache(maxsize=None)
+def get_llm_client(mode: str = "interactive") -> LLMClient:
     """Create OpenAI LLM client instance with configuration.
     
-    Factory function for creating LLM client with API key and model
-    settings from application configuration.
+    Factory function for creating LLM client with model settings from
+    application configuration, backed by the shared OpenAI client. Cached,
+    so each mode has one client (and one audit result cache) per process.
+    
+    Args:
+        mode: "interactive" for per-request audits, or "batch" for a client
+            that can also run bulk audits through the OpenAI Batch API
     
     Returns:
         LLMClient: Configured OpenAI client for AI-powered analysis
     """
-    return LLMClient(settings.openai_api_key, settings.openai_model)
+    client_class = BatchLLMClient if mode == "batch" else LLMClient
+    return client_class(model=settings.openai_model, client=_shared_openai())
 
 
-def get_audit_service() -> AuditService:
-    """Create complete audit service with all dependencies.
+def get_audit_service(request: Request) -> AuditService:
+    """Provide the application-wide audit service.
+    
+    The service, its long-lived MCP client and its LLM client are built
+    once in the application lifespan and stored on the application state,
+    so every request shares the same clients and their connection pools.
     
-    Factory function that creates and wires together all components needed
-    for web audits: MCP client for browser automation, LLM client for AI
-    analysis, and the audit service that coordinates between them.
+    Used by FastAPI dependency injection to provide the AuditService
+    instance to route handlers.
     
-    Used by FastAPI dependency injection to provide AuditService instances
-    to route handlers.
+    Args:
+        request: Incoming request, used to reach the application state
     
     Returns:
-        AuditService: Fully configured audit service with all dependencies
+        AuditService: Shared, fully configured audit service
     """
-    # Create and inject dependencies for complete audit pipeline
-    mcp_client = get_mcp_client()  # Chrome DevTools browser automation
-    llm_client = get_llm_client()  # OpenAI AI-powered analysis
-    return AuditService(mcp_client, llm_client)
\ No newline at end of file
+    return request.app.state.audit_service
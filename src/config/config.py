@@ -6,17 +6,14 @@ and essential tools configuration. Settings are loaded from environment
 variables and .env file with type validation.
 """
 
-import os
+from functools import lru_cache
 from pathlib import Path
-from pydantic_settings import BaseSettings
-from dotenv import load_dotenv
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 # Get the project root directory (two levels up from this file)
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 ENV_FILE = PROJECT_ROOT / ".env"
 
-# Load the .env file
-load_dotenv(ENV_FILE)
 
 class Settings(BaseSettings):
     """Application settings with environment variable support.
@@ -27,27 +24,48 @@ class Settings(BaseSettings):
     
     Environment variables can override defaults (e.g., OPENAI_API_KEY).
     """
+    model_config = SettingsConfigDict(env_file=str(ENV_FILE), env_file_encoding='utf-8', extra='ignore')
+
+    environment: str = ""  # Deployment environment (development/testing/production); empty when ENVIRONMENT is unset
+
     # FastAPI Server Configuration
     api_host: str = "0.0.0.0"
     api_port: int = 9000
+    api_reload: bool = False  # Auto-reload on code changes (development only)
+    api_workers: int = 1  # Uvicorn worker processes (each runs its own MCP client); ignored with reload
+    cors_origins: list = ["http://localhost:9000", "http://127.0.0.1:9000"]  # Allowed browser origins (JSON list in env)
+    expose_openapi: bool = True  # Serve /openapi.json (required by the /docs page)
+    api_access_log: bool = False  # Per-request uvicorn access log (LoggingMiddleware already logs requests)
 
     # Multi-container MCP Service Configuration
+    mcp_transport: str = "auto"  # "http" (shared MCP service), "stdio" (local subprocess) or "auto"
     mcp_service_url: str = "http://chrome-mcp:3001"  # MCP service URL for multi-container setup
     mcp_service_timeout: int = 60  # HTTP timeout for MCP service calls
     mcp_service_retries: int = 3  # Number of retry attempts for MCP service
+    mcp_service_max_connections: int = 100  # Pooled keep-alive connections to the MCP service
+    mcp_service_keepalive: int = 60  # Seconds an idle pooled connection is kept open
+    mcp_tools_cache_ttl: int = 300  # Seconds to reuse the MCP service tool list
 
     # OpenAI LLM Configuration
     openai_api_key: str
     openai_model: str = "gpt-4o-mini"  # GPT model for audit analysis
+    openai_summary_model: str = "gpt-4o-mini"  # Smaller model for the Call #3 executive summary
     
     # OpenAI API Behavior and Performance Settings
     llm_temperature: float = 0.1  # Low temperature for consistent, deterministic audit results
     llm_tool_choice: str = "auto"  # Let LLM automatically choose which tools to use
     llm_timeout: int = 120  # Maximum seconds to wait for LLM response
     llm_max_retries: int = 3  # Number of retry attempts on LLM API failures
+    llm_max_connections: int = 100  # Pooled aiohttp connections to the OpenAI API
+    openai_rpm: int = 0  # Requests per minute allowed per model in this process (0 disables limiting)
+    openai_tpm: int = 0  # Tokens per minute allowed per model in this process (0 disables limiting)
+    llm_batch_completion_window: str = "24h"  # Batch API completion window for bulk audits
+    llm_batch_poll_interval: int = 30  # Seconds between Batch API status checks
+    audit_cache_ttl: int = 900  # Seconds to reuse a completed audit for the same URL (0 disables)
+    audit_cache_size: int = 128  # Maximum number of cached audit results
     
     # Chrome DevTools MCP Tools - Essential browser automation functions
-    essential_tools: list = [
+    essential_tools: frozenset = frozenset({
         "navigate_page",  # Navigate to target URL - required for all audits
         "performance_start_trace",  # Begin performance measurement - Core Web Vitals
         "performance_stop_trace",  # End performance measurement - get results
@@ -57,7 +75,16 @@ class Settings(BaseSettings):
         "emulate_network",  # Test mobile performance - 3G/4G simulation
         "list_console_messages",  # Check for errors - security violations, JS errors
         "take_screenshot"  # Visual documentation - executive reporting
-    ]
+    })
+
+    # Tools that change browser state and must run in the order the LLM chose.
+    # Consecutive calls to any other (read-only) tool are executed concurrently.
+    stateful_tools: frozenset = frozenset({
+        "navigate_page",  # Loads the page every later tool inspects
+        "performance_start_trace",  # Reloads the page and starts recording
+        "performance_stop_trace",  # Ends recording started above
+        "emulate_network"  # Changes throttling for subsequent requests
+    })
     
     # Node.js MCP Server Process Configuration
     mcp_server_path: str = "npx"  # Command to run MCP server
@@ -67,6 +94,8 @@ class Settings(BaseSettings):
     mcp_headless: bool = True  # Run Chrome in headless mode for server environments
     mcp_isolated: bool = True  # Run Chrome in isolated mode for security
     mcp_startup_timeout: int = 2  # Seconds to wait for MCP server startup
+    mcp_shutdown_timeout: float = 2.0  # Seconds to wait after SIGTERM before killing the MCP server
+    tools_cache_path: str = str(PROJECT_ROOT / ".cache" / "mcp_tools.json")  # Persisted MCP tool list
     
     # Model Context Protocol Communication Settings
     mcp_protocol_version: str = "2024-11-05"  # MCP protocol version for compatibility
@@ -78,17 +107,19 @@ class Settings(BaseSettings):
     mcp_max_retries: int = 3  # Number of retry attempts on MCP failures
     mcp_retry_delay: float = 1.0  # Seconds between retry attempts
     mcp_request_timeout: int = 60  # Seconds to wait for individual tool responses
-    
-    # JSON-RPC Protocol IDs for MCP Communication
-    mcp_init_id: int = 1  # JSON-RPC ID for initialization requests
-    mcp_call_id: int = 2  # JSON-RPC ID for tool call requests
-    mcp_list_id: int = 3  # JSON-RPC ID for tool list requests
+    mcp_max_concurrency: int = 4  # Maximum read-only tool calls in flight against one browser
+    tool_result_max_chars: int = 4000  # Longest tool output string sent to the analysis call
+    tool_result_max_items: int = 50  # Most recent list entries kept per tool output
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings, parsing the environment only once.
 
-    class Config:
-        env_file = str(ENV_FILE)
-        env_file_encoding = 'utf-8'
+    Returns:
+        Settings: Validated application settings
+    """
+    return Settings()
 
 
-settings = Settings()
\ No newline at end of file
+settings = get_settings()
\ No newline at end of file
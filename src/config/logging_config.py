@@ -1,19 +1,21 @@
 """Logging system configuration for the Web Audit Agent.
 
 This module configures the application's logging system with multiple log files,
-custom log levels (including METRIC level), file rotation, and environment-based
+a dedicated metrics logger, file rotation, and environment-based
 settings. Provides structured logging for debugging, monitoring, and metrics.
 """
 
 import os
-import logging
 from pathlib import Path
-from pydantic_settings import BaseSettings
+from typing import Optional
+from pydantic import AliasChoices, Field, field_validator, model_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 # Project root directory
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 LOGS_DIR = PROJECT_ROOT / "logs"
 
+
 class LoggingConfig(BaseSettings):
     """Logging configuration settings with environment variable support.
     
@@ -25,24 +27,35 @@ class LoggingConfig(BaseSettings):
     
     Supports file rotation, retention policies, and custom log levels.
     """
-    # Environment Configuration
-    environment: str = os.getenv("ENVIRONMENT", "development")
+    model_config = SettingsConfigDict(
+        env_prefix="LOG_",
+        env_file=str(PROJECT_ROOT / ".env"),
+        env_file_encoding="utf-8",
+        extra="ignore"
+    )
+
+    # Environment Configuration (shared ENVIRONMENT variable, not LOG_-prefixed)
+    environment: str = Field("development", validation_alias=AliasChoices("LOG_ENVIRONMENT", "ENVIRONMENT"))
     
-    # Log Level Configuration (supports custom METRIC level = 25)
+    # Log Level Configuration
     log_level: str = "INFO"
     
-    # Log File Names and Directory Configuration
-    log_dir: Path = LOGS_DIR
-    app_log_file: str = "app.log"
-    error_log_file: str = "error.log"
-    metric_log_file: str = "metrics.log"
-    debug_log_file: str = "debug.log"
+    # Log Directory and File Path Configuration
+    log_dir: str = str(LOGS_DIR)
+    app_log_path: Optional[str] = None  # Defaults to <log_dir>/app.log
+    error_log_path: Optional[str] = None  # Defaults to <log_dir>/error.log
+    metric_log_path: Optional[str] = None  # Defaults to <log_dir>/metrics.log
+    debug_log_path: Optional[str] = None  # Defaults to <log_dir>/debug.log
     
     # File Rotation and Retention Settings
-    max_file_size: str = "10MB"
+    max_file_bytes: int = Field(
+        10 * 1024 * 1024,
+        validation_alias=AliasChoices("LOG_MAX_FILE_BYTES", "LOG_MAX_FILE_SIZE"),
+    )  # Accepts sizes like "10MB" from the environment
     backup_count: int = 5
     retention_days: int = 30
     error_retention_days: int = 90
+    buffer_capacity: int = 256  # Records buffered per log file before a write; ERROR+ flushes at once (0 disables)
     
     # Log Message Format Configuration
     log_format: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -51,31 +64,46 @@ class LoggingConfig(BaseSettings):
     # Console Output Configuration
     console_enabled: bool = True
     console_colors: bool = True
-    
-    class Config:
-        env_prefix = "LOG_"
 
-# Add custom METRIC level for business and performance metrics
-METRIC_LEVEL = 25
-logging.addLevelName(METRIC_LEVEL, "METRIC")
+    @field_validator("max_file_bytes", mode="before")
+    @classmethod
+    def parse_max_file_bytes(cls, v):
+        """Convert human-readable sizes to bytes once at settings load."""
+        return _parse_size(v) if isinstance(v, str) else v
+
+    @model_validator(mode="after")
+    def resolve_log_paths(self) -> "LoggingConfig":
+        """Place log files that have no explicit path inside log_dir."""
+        self.app_log_path = self.app_log_path or os.path.join(self.log_dir, "app.log")
+        self.error_log_path = self.error_log_path or os.path.join(self.log_dir, "error.log")
+        self.metric_log_path = self.metric_log_path or os.path.join(self.log_dir, "metrics.log")
+        self.debug_log_path = self.debug_log_path or os.path.join(self.log_dir, "debug.log")
+        return self
 
-def metric(self, message, *args, **kwargs):
-    """Custom logging method for business and performance metrics.
+def _parse_size(size_str: str) -> int:
+    """Convert human-readable size string to bytes.
     
-    Logs at METRIC level (25) which is between INFO (20) and WARNING (30).
-    Used for tracking audit completion times, performance scores, and
-    business intelligence data.
+    Supports KB, MB, GB suffixes for file rotation configuration.
     
     Args:
-        message: Log message format string
-        *args: Message format arguments
-        **kwargs: Additional logging keyword arguments
+        size_str: Size string like '10MB', '500KB', '1GB'
+        
+    Returns:
+        int: Size in bytes
     """
-    if self.isEnabledFor(METRIC_LEVEL):
-        self._log(METRIC_LEVEL, message, args, **kwargs)
+    size_str = size_str.upper()
+    if size_str.endswith('MB'):
+        return int(size_str[:-2]) * 1024 * 1024
+    elif size_str.endswith('KB'):
+        return int(size_str[:-2]) * 1024
+    elif size_str.endswith('GB'):
+        return int(size_str[:-2]) * 1024 * 1024 * 1024
+    else:
+        return int(size_str)
 
-# Extend Logger class with custom metric method
-logging.Logger.metric = metric
+# Parent logger for business and performance metrics; child loggers
+# (metrics.<module>) are written to the metrics log file
+METRICS_LOGGER_NAME = "metrics"
 
 # Global logging configuration instance
 logging_config = LoggingConfig()
\ No newline at end of file
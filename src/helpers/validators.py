@@ -6,15 +6,25 @@ URL format errors and security issues.
 """
 
 import re
-from urllib.parse import urlparse
 from helpers.exceptions import URLValidationError
 
+# Longest URL accepted; the URL is embedded in the audit prompt
+MAX_URL_LENGTH = 2048
+
+# Whole-string match: HTTP/HTTPS scheme, a non-empty network location and an
+# optional path/query/fragment, with no whitespace or control characters anywhere
+_URL_RE = re.compile(
+    r'https?://[^/?#\s\x00-\x1f\x7f]+(?:[/?#][^\s\x00-\x1f\x7f]*)?',
+    re.IGNORECASE,
+)
+
 
 def validate_url(url: str) -> bool:
     """Validate URL format and scheme for web audit compatibility.
     
     Checks that the URL has proper format with valid scheme and netloc.
-    Only allows HTTP and HTTPS protocols for security and compatibility.
+    Only allows HTTP and HTTPS protocols for security and compatibility, and
+    rejects whitespace, control characters and URLs over MAX_URL_LENGTH.
     
     Args:
         url: URL string to validate
@@ -25,19 +35,6 @@ def validate_url(url: str) -> bool:
     Raises:
         URLValidationError: If URL format is invalid or uses unsupported scheme
     """
-    try:
-        # Parse URL components
-        result = urlparse(url)
-        
-        # Ensure URL has both scheme and network location
-        if not all([result.scheme, result.netloc]):
-            raise URLValidationError(url)
-            
-        # Only allow HTTP/HTTPS for web audit compatibility
-        if result.scheme not in ['http', 'https']:
-            raise URLValidationError(url)
-            
-        return True
-    except Exception:
-        # Re-raise as URLValidationError for consistent error handling
-        raise URLValidationError(url)
\ No newline at end of file
+    if len(url) > MAX_URL_LENGTH or not _URL_RE.fullmatch(url):
+        raise URLValidationError(url)
+    return True
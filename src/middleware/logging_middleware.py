@@ -5,26 +5,31 @@ logs request/response timing and status, and tracks performance metrics
 for monitoring and debugging purposes.
 """
 
+import logging
 import time
-import uuid
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
-from utils.logger import get_logger
+from utils.logger import get_logger, get_metric_logger
 from utils.log_context import log_context
 
 logger = get_logger(__name__)
+metrics_logger = get_metric_logger(__name__)
+
+# Levels are fixed once logging is configured, so check once instead of per request
+_METRIC_ENABLED = metrics_logger.isEnabledFor(logging.INFO)
 
 class LoggingMiddleware(BaseHTTPMiddleware):
     """FastAPI middleware for request/response logging with correlation IDs"""
     
     async def dispatch(self, request: Request, call_next):
         # Generate correlation ID
-        correlation_id = str(uuid.uuid4())[:8]
+        correlation_id = log_context.new_correlation_id()
         
         # Start timing
-        start_time = time.time()
+        start_time = time.perf_counter()
         
-        with log_context.correlation_id(correlation_id):
+        token = log_context.set_correlation_id(correlation_id)
+        try:
             # Log request start
             logger.info("[request_id=%s] %s %s started", 
                        correlation_id, request.method, request.url.path)
@@ -37,7 +42,7 @@ class LoggingMiddleware(BaseHTTPMiddleware):
                 response = await call_next(request)
                 
                 # Calculate duration
-                duration = time.time() - start_time
+                duration = time.perf_counter() - start_time
                 
                 # Log successful completion
                 logger.info("[request_id=%s] %s %s completed in %.2fs status=%d", 
@@ -45,9 +50,10 @@ class LoggingMiddleware(BaseHTTPMiddleware):
                            duration, response.status_code)
                 
                 # Log performance metric
-                logger.metric("[api_performance] method=%s path=%s duration=%.2fs status=%d correlation_id=%s",
-                             request.method, request.url.path, duration, 
-                             response.status_code, correlation_id)
+                if _METRIC_ENABLED:
+                    metrics_logger.info("[api_performance] method=%s path=%s duration=%.2fs status=%d correlation_id=%s",
+                                        request.method, request.url.path, duration, 
+                                        response.status_code, correlation_id)
                 
                 # Add correlation ID to response headers
                 response.headers["X-Correlation-ID"] = correlation_id
@@ -56,11 +62,13 @@ class LoggingMiddleware(BaseHTTPMiddleware):
                 
             except Exception as e:
                 # Calculate duration for failed requests
-                duration = time.time() - start_time
+                duration = time.perf_counter() - start_time
                 
                 # Log error
                 logger.error("[request_id=%s] %s %s failed in %.2fs: %s", 
                             correlation_id, request.method, request.url.path, 
                             duration, str(e), exc_info=True)
                 
-                raise
\ No newline at end of file
+                raise
+        finally:
+            log_context.reset_correlation_id(token)
\ No newline at end of file
@@ -2,9 +2,28 @@
 LLM Prompts for Web Audit Analysis
 """
 
-def get_web_audit_expert_prompt() -> str:
-    """System message defining web audit expert persona"""
-    return """You are a Senior Web Performance & Security Audit Expert with 10+ years experience.
+import orjson
+
+# JavaScript security check suggested to the model for evaluate_script.
+# Kept as a plain module constant so it is built once, not per prompt.
+SECURITY_SCRIPT = """() => {
+  return {
+    https: location.protocol === 'https:',
+    csp: !!document.querySelector('meta[http-equiv*="Content-Security-Policy"]'),
+    hsts: document.querySelector('meta[http-equiv*="Strict-Transport-Security"]'),
+    xframe: document.querySelector('meta[http-equiv*="X-Frame-Options"]'),
+    mixedContent: Array.from(document.querySelectorAll('img, script, link')).some(el => 
+      el.src && el.src.startsWith('http:') && location.protocol === 'https:'
+    ),
+    vulnerabilities: {
+      xss: document.querySelector('script[src*="eval"]') ? 'potential' : 'none',
+      csrf: document.querySelector('meta[name="csrf-token"]') ? 'protected' : 'vulnerable'
+    }
+  }
+}
+"""
+
+_WEB_AUDIT_EXPERT_PROMPT = """You are a Senior Web Performance & Security Audit Expert with 10+ years experience.
 
 EXPERTISE AREAS:
 - Core Web Vitals optimization (LCP, FID, CLS, INP)
@@ -33,14 +52,18 @@ QUALITY REQUIREMENTS:
 - Provide actionable recommendations with business impact"""
 
 
-def get_structured_audit_prompt(url: str) -> str:
-    """Enhanced tool selection prompt with workflow guidance"""
-    return f"""Perform a comprehensive web audit of: {url}
+def get_web_audit_expert_prompt() -> str:
+    """System message defining web audit expert persona"""
+    return _WEB_AUDIT_EXPERT_PROMPT
+
+
+# Everything before the target URL, formatted once at import
+_STRUCTURED_AUDIT_PREFIX = f"""Perform a comprehensive web audit of the TARGET URL given at the end of this message.
 
 REQUIRED WORKFLOW (Execute in this order):
 
 Phase 1 - Foundation Setup:
-1. navigate_page(url="{url}") - Establish audit context
+1. navigate_page(url=TARGET URL) - Establish audit context
 2. take_snapshot() - Capture DOM structure for analysis
 
 Phase 2 - Performance Analysis:
@@ -65,33 +88,23 @@ CRITICAL REQUIREMENTS:
 SECURITY SCRIPT TEMPLATE:
 Use evaluate_script with this comprehensive security check:
 ```javascript
-() => {{
-  return {{
-    https: location.protocol === 'https:',
-    csp: !!document.querySelector('meta[http-equiv*="Content-Security-Policy"]'),
-    hsts: document.querySelector('meta[http-equiv*="Strict-Transport-Security"]'),
-    xframe: document.querySelector('meta[http-equiv*="X-Frame-Options"]'),
-    mixedContent: Array.from(document.querySelectorAll('img, script, link')).some(el => 
-      el.src && el.src.startsWith('http:') && location.protocol === 'https:'
-    ),
-    vulnerabilities: {{
-      xss: document.querySelector('script[src*="eval"]') ? 'potential' : 'none',
-      csrf: document.querySelector('meta[name="csrf-token"]') ? 'protected' : 'vulnerable'
-    }}
-  }}
-}}
-```
+{SECURITY_SCRIPT}```
 
-Execute all required tools systematically. Focus on actionable insights."""
+Execute all required tools systematically. Focus on actionable insights.
 
+TARGET URL: """
 
-def get_audit_analysis_prompt(url: str, mcp_data: dict) -> str:
-    """Enhanced audit analysis prompt with vulnerability object mapping"""
-    return f"""
-Senior Web Audit Expert: Generate comprehensive audit report.
 
-URL: {url}
-Tool Results: {mcp_data}
+def get_structured_audit_prompt(url: str) -> str:
+    """Enhanced tool selection prompt with workflow guidance.
+
+    The target URL is appended at the very end so the instructions before it
+    form a stable prefix that OpenAI can serve from its prompt cache.
+    """
+    return _STRUCTURED_AUDIT_PREFIX + url
+
+
+_AUDIT_ANALYSIS_SYSTEM_PROMPT = """Senior Web Audit Expert: Generate comprehensive audit report from the URL and tool results provided by the user.
 
 ANALYSIS MAPPING:
 
@@ -133,13 +146,20 @@ Do not include any explanatory text outside the JSON.
 """
 
 
-def get_executive_summary_prompt(audit_data: dict) -> str:
-    """Generate executive summary prompt for C-suite reporting"""
-    return f"""
-As a Senior Digital Strategy Consultant, create an executive summary for C-suite leadership.
+def get_audit_analysis_system_prompt() -> str:
+    """Static audit analysis instructions with vulnerability object mapping"""
+    return _AUDIT_ANALYSIS_SYSTEM_PROMPT
 
-AUDIT DATA:
-{audit_data}
+
+def get_audit_analysis_prompt(url: str, mcp_data: dict) -> str:
+    """Audit-specific analysis input: target URL and collected tool results as JSON"""
+    payload = orjson.dumps(mcp_data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    return f"""URL: {url}
+Tool Results: {payload}
+"""
+
+
+_EXECUTIVE_SUMMARY_SYSTEM_PROMPT = """As a Senior Digital Strategy Consultant, create an executive summary for C-suite leadership from the audit data provided by the user.
 
 EXECUTIVE REQUIREMENTS:
 - Business impact assessment (revenue, user experience, brand risk)
@@ -163,4 +183,17 @@ DELIVER:
 - action_timeline: Implementation phases with resource needs
 
 Return ONLY valid JSON matching the ExecutiveSummary schema.
-"""
\ No newline at end of file
+"""
+
+
+def get_executive_summary_system_prompt() -> str:
+    """Static executive summary instructions for C-suite reporting"""
+    return _EXECUTIVE_SUMMARY_SYSTEM_PROMPT
+
+
+def get_executive_summary_prompt(audit_data: dict) -> str:
+    """Audit-specific executive summary input as JSON"""
+    payload = orjson.dumps(audit_data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    return f"""AUDIT DATA:
+{payload}
+"""
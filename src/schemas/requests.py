@@ -5,7 +5,9 @@ models. Provides type validation and URL format validation for incoming
 audit requests via the REST API.
 """
 
-from pydantic import BaseModel, HttpUrl, Field
+from pydantic import BaseModel, Field, field_validator
+from helpers.exceptions import URLValidationError
+from helpers.validators import validate_url
 
 
 class AuditRequest(BaseModel):
@@ -14,7 +16,21 @@ class AuditRequest(BaseModel):
     Simple request structure requiring only a target URL.
     Automatically validates URL format (must be valid HTTP/HTTPS).
     """
-    url: HttpUrl = Field(
+    url: str = Field(
         description="Target website URL to audit (must be valid HTTP/HTTPS)",
         examples=["https://example.com", "https://www.google.com"]
-    )
\ No newline at end of file
+    )
+
+    @field_validator("url")
+    @classmethod
+    def check_url(cls, v: str) -> str:
+        """Validate the URL with the lightweight audit URL check.
+        
+        Raises:
+            ValueError: If the URL is not HTTP/HTTPS with a host, reported as a 422
+        """
+        try:
+            validate_url(v)
+        except URLValidationError as e:
+            raise ValueError(e.detail) from None
+        return v
\ No newline at end of file
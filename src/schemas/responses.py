@@ -1,9 +1,12 @@
+import secrets
+import time
+from datetime import datetime, timezone
 from typing import List
 from pydantic import BaseModel, Field
 
 
 class CoreWebVitals(BaseModel):
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "frozen": True}
     
     lcp: float
     fid: float
@@ -11,7 +14,7 @@ class CoreWebVitals(BaseModel):
 
 
 class PerformanceResults(BaseModel):
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "frozen": True}
     
     core_web_vitals: CoreWebVitals
     lighthouse_score: int
@@ -19,7 +22,7 @@ class PerformanceResults(BaseModel):
 
 
 class Vulnerability(BaseModel):
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "frozen": True}
     
     name: str
     severity: str
@@ -27,7 +30,7 @@ class Vulnerability(BaseModel):
 
 
 class SecurityResults(BaseModel):
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "frozen": True}
     
     https_enabled: bool
     csp_header: str
@@ -38,7 +41,7 @@ class SecurityResults(BaseModel):
 
 
 class Recommendation(BaseModel):
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "frozen": True}
     
     category: str
     priority: str
@@ -48,7 +51,7 @@ class Recommendation(BaseModel):
 
 
 class ExecutiveSummary(BaseModel):
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "frozen": True}
     
     business_impact: str
     key_risks: List[str]
@@ -59,11 +62,15 @@ class ExecutiveSummary(BaseModel):
 
 class AuditResponse(BaseModel):
     """Complete web audit response with performance, security, and business insights."""
-    model_config = {"extra": "forbid"}
+    # Defaults only fill gaps in model output; the serialization-mode schema sent
+    # to OpenAI still lists every field as required for strict structured outputs.
+    # Frozen like the nested models so cached audits can be shared between requests;
+    # derive variations with model_copy(update=...)
+    model_config = {"extra": "forbid", "frozen": True, "json_schema_serialization_defaults_required": True}
     
-    audit_id: str
+    audit_id: str = Field(default_factory=lambda: f"{time.time_ns() // 1_000_000:x}{secrets.token_hex(4)}")
     url: str
-    timestamp: str
+    timestamp: str = Field(default_factory=lambda: datetime.now(timezone.utc).isoformat(timespec="seconds"))
     performance: PerformanceResults
     security: SecurityResults
     recommendations: List[Recommendation]
@@ -1,51 +1,86 @@
 """Logging context management for correlation tracking and performance monitoring.
 
-This module provides thread-safe context managers for tracking request correlation IDs,
+This module provides async-safe context managers for tracking request correlation IDs,
 execution timing, and memory usage across the audit pipeline. Essential for debugging
 distributed operations and monitoring system performance.
 """
 
+import itertools
+import logging
+import os
 import time
-import uuid
-import psutil
-import threading
+import secrets
 from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from functools import lru_cache
 from typing import Optional
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Per-task correlation ID; each asyncio task sees its own value
+_correlation_id: ContextVar[Optional[str]] = ContextVar("correlation_id", default=None)
+
+# Correlation IDs are a random per-process seed XOR a counter: unique within the
+# process for 2**32 requests without a urandom read per request
+_CORRELATION_SEED = secrets.randbits(32)
+_correlation_counter = itertools.count()
+
+# Converts the statm resident page count to bytes
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
 class LogContext:
-    """Thread-safe context manager for correlation IDs and performance tracking.
+    """Async-safe context manager for correlation IDs and performance tracking.
     
     Provides context managers for:
     - Correlation ID tracking across async operations
     - Execution timing for performance monitoring
     - Memory usage tracking for resource optimization
     
-    Uses thread-local storage to maintain context isolation
-    between concurrent audit requests.
+    Uses a ContextVar to keep context isolated between concurrent audit
+    requests, which share one thread under asyncio.
     """
     
-    _local = threading.local()
+    __slots__ = ()  # All state lives in module-level ContextVars
     
     @classmethod
     def get_correlation_id(cls) -> Optional[str]:
-        """Get correlation ID for current thread.
+        """Get correlation ID for the current context.
         
         Returns:
             Optional[str]: Current correlation ID or None if not set
         """
-        return getattr(cls._local, 'correlation_id', None)
+        return _correlation_id.get()
     
     @classmethod
-    def set_correlation_id(cls, correlation_id: str) -> None:
-        """Set correlation ID for current thread.
+    def new_correlation_id(cls) -> str:
+        """Generate a new correlation ID.
+        
+        Returns:
+            str: 8-character hexadecimal correlation ID
+        """
+        return f"{(_CORRELATION_SEED ^ next(_correlation_counter)) & 0xFFFFFFFF:08x}"
+    
+    @classmethod
+    def set_correlation_id(cls, correlation_id: str) -> Token:
+        """Set correlation ID for the current context.
         
         Args:
             correlation_id: Unique identifier for request tracking
+            
+        Returns:
+            Token: Pass to reset_correlation_id() to restore the previous ID
+        """
+        return _correlation_id.set(correlation_id)
+    
+    @classmethod
+    def reset_correlation_id(cls, token: Token) -> None:
+        """Restore the correlation ID that was active before set_correlation_id().
+        
+        Args:
+            token: Token returned by set_correlation_id()
         """
-        cls._local.correlation_id = correlation_id
+        _correlation_id.reset(token)
     
     @classmethod
     @contextmanager
@@ -63,17 +98,13 @@ class LogContext:
             str: The correlation ID being used for this context
         """
         if correlation_id is None:
-            correlation_id = str(uuid.uuid4())[:8]
+            correlation_id = cls.new_correlation_id()
         
-        old_id = cls.get_correlation_id()
-        cls.set_correlation_id(correlation_id)
+        token = cls.set_correlation_id(correlation_id)
         try:
             yield correlation_id
         finally:
-            if old_id:
-                cls.set_correlation_id(old_id)
-            else:
-                cls._local.correlation_id = None
+            cls.reset_correlation_id(token)
     
     @classmethod
     @contextmanager
@@ -90,22 +121,25 @@ class LogContext:
             with log_context.timer("Complete Audit Pipeline"):
                 result = await audit_service.perform_audit(url)
         """
-        start_time = time.time()
-        start_memory = cls._get_memory_usage()
+        # Memory is only reported at DEBUG, so skip sampling it otherwise
+        track_memory = logger.isEnabledFor(logging.DEBUG)
+        start_time = time.perf_counter()
+        start_memory = cls._get_memory_usage() if track_memory else 0.0
         
         logger.info("Starting %s", operation_name)
-        logger.debug("[memory] Initial usage: %.1f MB", start_memory)
+        if track_memory:
+            logger.debug("[memory] Initial usage: %.1f MB", start_memory)
         
         try:
             yield
         finally:
-            end_time = time.time()
-            end_memory = cls._get_memory_usage()
-            execution_time = end_time - start_time
+            execution_time = time.perf_counter() - start_time
             
             logger.info("✓ %s completed in %.2fs", operation_name, execution_time)
-            logger.debug("[memory] Final usage: %.1f MB (delta: %.1f MB)", 
-                        end_memory, end_memory - start_memory)
+            if track_memory:
+                end_memory = cls._get_memory_usage()
+                logger.debug("[memory] Final usage: %.1f MB (delta: %.1f MB)", 
+                            end_memory, end_memory - start_memory)
     
     @classmethod
     @contextmanager
@@ -119,27 +153,46 @@ class LogContext:
             with log_context.memory_tracker():
                 large_operation()
         """
-        initial_memory = cls._get_memory_usage()
-        logger.info("Initial memory usage: %.1f MB", initial_memory)
+        if not logger.isEnabledFor(logging.INFO):
+            yield
+            return
+        
+        logger.info("Initial memory usage: %.1f MB", cls._get_memory_usage())
         
         try:
             yield
         finally:
-            final_memory = cls._get_memory_usage()
-            logger.info("Final memory usage: %.1f MB", final_memory)
+            logger.info("Final memory usage: %.1f MB", cls._get_memory_usage())
     
     @classmethod
     def _get_memory_usage(cls) -> float:
         """Get current process memory usage in megabytes.
         
+        Reads the resident page count from /proc/self/statm on Linux and
+        falls back to psutil elsewhere.
+        
         Returns:
             float: Memory usage in MB, or 0.0 if unable to determine
         """
         try:
-            process = psutil.Process()
-            return process.memory_info().rss / 1024 / 1024
+            with open("/proc/self/statm", "rb") as f:
+                return int(f.read().split()[1]) * _PAGE_SIZE / 1024 / 1024
+        except OSError:
+            pass
+        try:
+            return _psutil_process().memory_info().rss / 1024 / 1024
         except Exception:
             return 0.0
 
+@lru_cache(maxsize=1)
+def _psutil_process():
+    """Return a psutil handle for this process, importing psutil on first use.
+    
+    Only needed where /proc/self/statm is unavailable, so psutil is not
+    loaded at all on Linux.
+    """
+    import psutil
+    return psutil.Process(os.getpid())
+
 # Global log context instance for application-wide use
 log_context = LogContext()
\ No newline at end of file
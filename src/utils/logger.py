@@ -2,63 +2,96 @@
 
 This module configures the application's multi-file logging system with
 environment-based settings, colored console output, file rotation, and
-custom METRIC level support. Provides the main logger factory function
-used throughout the application.
+a dedicated metrics logger. Handlers run on a background QueueListener
+thread, so logging calls never block on disk I/O. Provides the logger
+factory functions used throughout the application.
 """
 
+import atexit
 import logging
 import logging.handlers
+import os
+import queue
 import sys
 from pathlib import Path
 from typing import Optional
-from config.logging_config import logging_config, METRIC_LEVEL
+from config.logging_config import logging_config, METRICS_LOGGER_NAME
+
+# Background thread writing queued records to the real handlers
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+# Set once setup_logging() has run, so later calls don't rebuild the handlers
+_initialized = False
 
 class ColoredFormatter(logging.Formatter):
     """Custom formatter that adds colors to console log output.
     
     Provides color-coded log levels for better readability during development.
-    Colors are only applied when console_colors is enabled in configuration.
+    Only used when console_colors is enabled in configuration. The record's
+    level name is restored after formatting, so other handlers see it plain.
     """
     
     COLORS = {
         'DEBUG': '\033[36m',     # Cyan
         'INFO': '\033[32m',      # Green
-        'METRIC': '\033[35m',    # Magenta
         'WARNING': '\033[33m',   # Yellow
         'ERROR': '\033[31m',     # Red
         'CRITICAL': '\033[41m',  # Red background
         'RESET': '\033[0m'       # Reset
     }
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Colored level names, built once instead of per record
+        reset = self.COLORS['RESET']
+        self._colored_levelnames = {
+            level: f"{color}{level}{reset}"
+            for level, color in self.COLORS.items() if level != 'RESET'
+        }
+    
     def format(self, record):
-        if logging_config.console_colors:
-            color = self.COLORS.get(record.levelname, self.COLORS['RESET'])
-            record.levelname = f"{color}{record.levelname}{self.COLORS['RESET']}"
-        return super().format(record)
+        levelname = record.levelname
+        record.levelname = self._colored_levelnames.get(levelname, levelname)
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = levelname
 
-def setup_logging(environment: str = None) -> None:
+def setup_logging(environment: str = None, force: bool = False) -> None:
     """Configure comprehensive logging system based on environment.
     
     Sets up multiple log handlers for different purposes:
     - Console output (development only) with colors
     - Application log file (INFO+ messages)
     - Error log file (ERROR+ messages)
-    - Metrics log file (METRIC level only)
+    - Metrics log file (metrics logger only)
     - Debug log file (development only)
     
+    The handlers are driven by a QueueListener thread; the root logger only
+    gets a QueueHandler that enqueues each record.
+    
+    Runs once per process; later calls are no-ops unless force is set.
+    
     Args:
         environment: Target environment (development, testing, production)
                     Defaults to value from logging_config
+        force: Rebuild the handlers even if logging is already configured
     """
     
+    global _queue_listener, _initialized
+    if _initialized and not force:
+        return
+    _initialized = False  # Set again only once the new handlers are running
     env = environment or logging_config.environment
     
     # Ensure logs directory exists for file handlers
-    logging_config.log_dir.mkdir(parents=True, exist_ok=True)
+    os.makedirs(logging_config.log_dir, exist_ok=True)
     
     # Configure root logger and clear any existing handlers
+    _stop_queue_listener()
     root_logger = logging.getLogger()
     root_logger.handlers.clear()
+    handlers = []
     
     # Adjust log level based on deployment environment
     if env == "development":
@@ -79,54 +112,106 @@ def setup_logging(environment: str = None) -> None:
     if env == "development" and logging_config.console_enabled:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(logging.INFO)  # Only INFO+ to console
-        console_formatter = ColoredFormatter(logging_config.log_format)
+        formatter_class = ColoredFormatter if logging_config.console_colors else logging.Formatter
+        console_formatter = formatter_class(logging_config.log_format)
         console_handler.setFormatter(console_formatter)
-        root_logger.addHandler(console_handler)
+        handlers.append(console_handler)
     
     # Configure file-based logging handlers (skip for testing)
     if env != "testing":  # No file logging in testing
         
         # General application log with INFO and above
         app_handler = logging.handlers.RotatingFileHandler(
-            logging_config.log_dir / logging_config.app_log_file,
-            maxBytes=_parse_size(logging_config.max_file_size),
+            logging_config.app_log_path,
+            maxBytes=logging_config.max_file_bytes,
             backupCount=logging_config.backup_count
         )
         app_handler.setLevel(logging.INFO)
         app_handler.setFormatter(logging.Formatter(logging_config.log_format))
-        root_logger.addHandler(app_handler)
+        handlers.append(_buffered(app_handler))
         
         # Dedicated error log for ERROR and CRITICAL messages
         error_handler = logging.handlers.RotatingFileHandler(
-            logging_config.log_dir / logging_config.error_log_file,
-            maxBytes=_parse_size(logging_config.max_file_size),
+            logging_config.error_log_path,
+            maxBytes=logging_config.max_file_bytes,
             backupCount=logging_config.backup_count
         )
         error_handler.setLevel(logging.ERROR)
         error_handler.setFormatter(logging.Formatter(logging_config.log_format))
-        root_logger.addHandler(error_handler)
+        handlers.append(error_handler)
         
-        # Business metrics log (custom METRIC level only)
+        # Business metrics log, filtered to the metrics logger hierarchy;
+        # those records also reach the application log above
         metric_handler = logging.handlers.RotatingFileHandler(
-            logging_config.log_dir / logging_config.metric_log_file,
-            maxBytes=_parse_size(logging_config.max_file_size),
+            logging_config.metric_log_path,
+            maxBytes=logging_config.max_file_bytes,
             backupCount=logging_config.backup_count
         )
-        metric_handler.setLevel(METRIC_LEVEL)
-        metric_handler.addFilter(lambda record: record.levelno == METRIC_LEVEL)
+        metric_handler.setLevel(logging.INFO)
         metric_handler.setFormatter(logging.Formatter(logging_config.log_format))
-        root_logger.addHandler(metric_handler)
+        buffered_metric_handler = _buffered(metric_handler)
+        buffered_metric_handler.addFilter(logging.Filter(METRICS_LOGGER_NAME))
+        handlers.append(buffered_metric_handler)
         
         # Detailed debug log for development troubleshooting
         if env == "development":
             debug_handler = logging.handlers.RotatingFileHandler(
-                logging_config.log_dir / logging_config.debug_log_file,
-                maxBytes=_parse_size(logging_config.max_file_size),
+                logging_config.debug_log_path,
+                maxBytes=logging_config.max_file_bytes,
                 backupCount=logging_config.backup_count
             )
             debug_handler.setLevel(logging.DEBUG)
             debug_handler.setFormatter(logging.Formatter(logging_config.log_format))
-            root_logger.addHandler(debug_handler)
+            handlers.append(_buffered(debug_handler))
+    
+    # Hand records to the handlers on a background thread
+    if handlers:
+        log_queue = queue.SimpleQueue()
+        _queue_listener = logging.handlers.QueueListener(
+            log_queue, *handlers, respect_handler_level=True
+        )
+        _queue_listener.start()
+        root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _initialized = True
+
+def _stop_queue_listener() -> None:
+    """Stop the background listener, write out queued and buffered records and close its handlers."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        # Close here: the handlers may be garbage collected before logging.shutdown(),
+        # and a forced reconfiguration would otherwise leak their open files
+        for handler in _queue_listener.handlers:
+            target = getattr(handler, "target", None)
+            handler.close()  # MemoryHandler flushes to its target, then drops it
+            if target is not None:
+                target.close()
+        _queue_listener = None
+
+def _buffered(handler: logging.Handler) -> logging.Handler:
+    """Wrap a file handler so records are written in batches.
+    
+    Records are held in memory until the buffer is full or an ERROR+ record
+    arrives. _stop_queue_listener() flushes the buffer at interpreter exit. The
+    error log is not wrapped since every record it receives would flush.
+    
+    Args:
+        handler: File handler that performs the actual writes
+        
+    Returns:
+        logging.Handler: Buffering handler, or the handler itself when disabled
+    """
+    if logging_config.buffer_capacity <= 0:
+        return handler
+    
+    buffered = logging.handlers.MemoryHandler(
+        capacity=logging_config.buffer_capacity,
+        flushLevel=logging.ERROR,
+        target=handler,
+        flushOnClose=True
+    )
+    buffered.setLevel(handler.level)
+    return buffered
 
 def get_logger(name: str = None) -> logging.Logger:
     """Factory function to get configured logger instance.
@@ -143,33 +228,31 @@ def get_logger(name: str = None) -> logging.Logger:
     """
     
     # Initialize logging system if not already configured
-    if not logging.getLogger().handlers:
+    if not _initialized:
         setup_logging()
     
     # Create module-specific logger instance
     logger_name = name or __name__
     return logging.getLogger(logger_name)
 
-def _parse_size(size_str: str) -> int:
-    """Convert human-readable size string to bytes.
+def get_metric_logger(name: str = None) -> logging.Logger:
+    """Factory function to get a logger for business and performance metrics.
     
-    Supports KB, MB, GB suffixes for file rotation configuration.
+    Metric loggers are children of the metrics logger, so their INFO records
+    go to the metrics log file as well as the regular application handlers.
     
     Args:
-        size_str: Size string like '10MB', '500KB', '1GB'
+        name: Logger name (typically __name__ from calling module)
         
     Returns:
-        int: Size in bytes
+        logging.Logger: Metrics logger for the calling module
     """
-    size_str = size_str.upper()
-    if size_str.endswith('MB'):
-        return int(size_str[:-2]) * 1024 * 1024
-    elif size_str.endswith('KB'):
-        return int(size_str[:-2]) * 1024
-    elif size_str.endswith('GB'):
-        return int(size_str[:-2]) * 1024 * 1024 * 1024
-    else:
-        return int(size_str)
+    if not _initialized:
+        setup_logging()
+    
+    return logging.getLogger(f"{METRICS_LOGGER_NAME}.{name or __name__}")
 
-# Auto-initialize logging system when module is imported
-setup_logging()
\ No newline at end of file
+# Auto-initialize logging system when module is imported; registered after
+# logging's own shutdown hook, so queued records are written before it runs
+setup_logging()
+atexit.register(_stop_queue_listener)
\ No newline at end of file
@@ -7,7 +7,7 @@ and understanding MCP capabilities.
 """
 
 import asyncio
-import json
+import orjson
 from datetime import datetime
 from pathlib import Path
 import sys
@@ -18,6 +18,21 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from clients.mcp_tool_client import MCPToolClient
 
+# Rule separating the report's major sections
+SECTION_RULE = "=" * 80
+
+# (name keyword, category) pairs; the first keyword found in a tool name wins
+_CATEGORY_RULES = (
+    ('navigate', 'Navigation'),
+    ('screenshot', 'Screenshot/Capture'),
+    ('capture', 'Screenshot/Capture'),
+    ('performance', 'Performance'),
+    ('metrics', 'Performance'),
+    ('security', 'Security'),
+    ('dom', 'DOM Manipulation'),
+    ('element', 'DOM Manipulation'),
+)
+
 
 async def export_mcp_tools():
     """Export comprehensive MCP tools documentation to text file.
@@ -40,13 +55,14 @@ async def export_mcp_tools():
     mcp_client = MCPToolClient()
     
     try:
-        # Get available tools
-        print("Connecting to MCP server...")
-        tools = await mcp_client.get_available_tools()
-        
         # Get raw MCP tools for detailed info
+        print("Connecting to MCP server...")
+        await mcp_client._ensure_connected()
         raw_tools = await mcp_client._get_mcp_tools()
         
+        # Derive the OpenAI format locally instead of a second tools/list round trip
+        tools = [mcp_client._transform_mcp_tool_to_openai(tool) for tool in raw_tools]
+        
         # Generate filename with current date
         current_date = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
         filename = f"mcp_tools_documentation_{current_date}.txt"
@@ -60,9 +76,8 @@ async def export_mcp_tools():
         # Generate report content
         content = generate_report_content(raw_tools, tools, current_date)
         
-        # Write to file
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
+        # Encode once and write the whole report in a single call
+        filepath.write_bytes(content.encode('utf-8'))
         
         print(f"✅ MCP tools exported successfully to: {filepath}")
         print(f"📊 Total tools found: {len(raw_tools)}")
@@ -73,9 +88,8 @@ async def export_mcp_tools():
         print(f"❌ Error exporting MCP tools: {e}")
         raise
     finally:
-        # Cleanup MCP connection
-        if mcp_client.process:
-            mcp_client.process.terminate()
+        # Stop the MCP server and wait for it to exit
+        await mcp_client.close()
 
 
 def generate_report_content(raw_tools: list, openai_tools: list, export_date: str) -> str:
@@ -93,53 +107,67 @@ def generate_report_content(raw_tools: list, openai_tools: list, export_date: st
         str: Complete formatted documentation content
     """
     
-    content = f"""
+    # Collect sections and join once; repeated += would copy the whole report each time
+    parts = [f"""
 # MCP Tools Export Report
 Generated on: {export_date}
 Total Tools: {len(raw_tools)}
 
-{'='*80}
+{SECTION_RULE}
 CHROME DEVTOOLS MCP SERVER - AVAILABLE TOOLS
-{'='*80}
+{SECTION_RULE}
 
-"""
+"""]
     
+    # Document each tool and categorize it by functionality in the same pass
+    categories = set()
     for i, tool in enumerate(raw_tools, 1):
-        content += f"""
-{i}. {tool.get('name', 'Unknown Tool')}
-{'-' * (len(str(i)) + 2 + len(tool.get('name', 'Unknown Tool')))}
+        name = tool.get('name', 'Unknown Tool')
+        lowered = name.lower()
+        category = 'Other'
+        for keyword, rule_category in _CATEGORY_RULES:
+            if keyword in lowered:
+                category = rule_category
+                break
+        categories.add(category)
+        
+        heading = f"{i}. {name}"
+        parts.append(f"""
+{heading}
+{'-' * len(heading)}
 
 Description: {tool.get('description', 'No description available')}
 
 Input Schema:
-{json.dumps(tool.get('inputSchema', {}), indent=2)}
+{orjson.dumps(tool.get('inputSchema', {}), option=orjson.OPT_INDENT_2).decode()}
 
-"""
+""")
     
-    content += f"""
-{'='*80}
+    parts.append(f"""
+{SECTION_RULE}
 OPENAI FUNCTION FORMAT (FOR LLM INTEGRATION)
-{'='*80}
+{SECTION_RULE}
 
-"""
+""")
     
     for i, tool in enumerate(openai_tools, 1):
         func = tool.get('function', {})
-        content += f"""
-{i}. {func.get('name', 'Unknown')}
-{'-' * (len(str(i)) + 2 + len(func.get('name', 'Unknown')))}
+        heading = f"{i}. {func.get('name', 'Unknown')}"
+        parts.append(f"""
+{heading}
+{'-' * len(heading)}
 
 Description: {func.get('description', 'No description')}
 
 Parameters:
-{json.dumps(func.get('parameters', {}), indent=2)}
+{orjson.dumps(func.get('parameters', {}), option=orjson.OPT_INDENT_2).decode()}
 
-"""
+""")
     
-    content += f"""
-{'='*80}
+    parts.append(f"""
+{SECTION_RULE}
 EXPORT SUMMARY
-{'='*80}
+{SECTION_RULE}
 
 Export Date: {export_date}
 MCP Server: chrome-devtools-mcp@latest
@@ -147,29 +175,12 @@ Protocol Version: 2024-11-05
 Client: web-audit-agent v1.0.0
 
 Tool Categories Detected:
-"""
-    
-    # Categorize tools by functionality for better organization
-    categories = set()
-    for tool in raw_tools:
-        name = tool.get('name', '')
-        if 'navigate' in name.lower():
-            categories.add('Navigation')
-        elif 'screenshot' in name.lower() or 'capture' in name.lower():
-            categories.add('Screenshot/Capture')
-        elif 'performance' in name.lower() or 'metrics' in name.lower():
-            categories.add('Performance')
-        elif 'security' in name.lower():
-            categories.add('Security')
-        elif 'dom' in name.lower() or 'element' in name.lower():
-            categories.add('DOM Manipulation')
-        else:
-            categories.add('Other')
+""")
     
     for category in sorted(categories):
-        content += f"- {category}\n"
+        parts.append(f"- {category}\n")
     
-    content += f"""
+    parts.append(f"""
 Total Available Tools: {len(raw_tools)}
 Successfully Transformed: {len(openai_tools)}
 
@@ -179,10 +190,10 @@ This export can be used for:
 - Tool documentation and reference
 - Debugging MCP connections
 
-{'='*80}
-"""
+{SECTION_RULE}
+""")
     
-    return content
+    return "".join(parts)
 
 
 if __name__ == "__main__":
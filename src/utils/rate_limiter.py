@@ -0,0 +1,116 @@
+"""Request and token rate limiting for OpenAI API calls.
+
+This module provides the RateLimiter class, a token bucket that tracks
+requests per minute and tokens per minute for one model. Calls wait until
+both budgets have room instead of failing with HTTP 429 and retrying, which
+keeps throughput steady when several audits run in parallel.
+"""
+
+import asyncio
+import time
+from functools import lru_cache
+from typing import Optional
+from config.config import settings
+
+
+class RateLimiter:
+    """Token bucket for requests per minute (RPM) and tokens per minute (TPM).
+
+    Both budgets refill continuously at limit/60 per second, up to one
+    minute's worth. A limit of 0 disables that dimension. Waiters are served
+    in arrival order.
+    """
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int):
+        """Initialize full request and token budgets.
+
+        Args:
+            requests_per_minute: Maximum requests per minute (0 for unlimited)
+            tokens_per_minute: Maximum tokens per minute (0 for unlimited)
+        """
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.available_requests = float(requests_per_minute)
+        self.available_tokens = float(tokens_per_minute)
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        """Add the budget earned since the last update."""
+        now = time.monotonic()
+        elapsed = now - self._updated_at
+        self._updated_at = now
+        self.available_requests = min(
+            self.requests_per_minute,
+            self.available_requests + elapsed * self.requests_per_minute / 60
+        )
+        self.available_tokens = min(
+            self.tokens_per_minute,
+            self.available_tokens + elapsed * self.tokens_per_minute / 60
+        )
+
+    async def acquire(self, tokens: int):
+        """Wait until one request and the estimated tokens fit the budgets.
+
+        Args:
+            tokens: Estimated tokens the request will consume
+        """
+        async with self._lock:
+            if self.tokens_per_minute:
+                # A single request may never need more than a full minute's budget
+                tokens = min(tokens, self.tokens_per_minute)
+
+            while True:
+                self._refill()
+                request_wait = 0.0
+                token_wait = 0.0
+                if self.requests_per_minute and self.available_requests < 1:
+                    request_wait = (1 - self.available_requests) * 60 / self.requests_per_minute
+                if self.tokens_per_minute and self.available_tokens < tokens:
+                    token_wait = (tokens - self.available_tokens) * 60 / self.tokens_per_minute
+
+                if not request_wait and not token_wait:
+                    self.available_requests -= 1
+                    self.available_tokens -= tokens
+                    return
+                await asyncio.sleep(max(request_wait, token_wait))
+
+    def record_usage(self, estimated_tokens: int, actual_tokens: int):
+        """Correct the token budget once the real usage of a request is known.
+
+        Args:
+            estimated_tokens: Tokens reserved by acquire()
+            actual_tokens: Total tokens reported by the API
+        """
+        if self.tokens_per_minute:
+            self.available_tokens -= actual_tokens - estimated_tokens
+
+
+@lru_cache(maxsize=None)
+def get_rate_limiter(model: str) -> Optional[RateLimiter]:
+    """Return the process-wide rate limiter for a model.
+
+    OpenAI enforces limits per model, so every client calling the same model
+    shares one limiter.
+
+    Args:
+        model: OpenAI model name
+
+    Returns:
+        RateLimiter for the model, or None when no limits are configured
+    """
+    if not settings.openai_rpm and not settings.openai_tpm:
+        return None
+    return RateLimiter(settings.openai_rpm, settings.openai_tpm)
+
+
+def estimate_tokens(payload: bytes) -> int:
+    """Roughly estimate the token count of a serialized request.
+
+    Args:
+        payload: JSON-encoded request messages and tools
+
+    Returns:
+        Estimated token count (about four bytes per token for English text)
+    """
+    return len(payload) // 4 + 1
@@ -0,0 +1,112 @@
+"""Static asset serving with an in-memory cache for small files.
+
+This module provides the CachedStaticFiles class used to serve the web
+interface's CSS, JS and image assets. Small files are kept in memory keyed
+by path and modification time, so repeat requests skip the disk read and
+conditional requests are answered with 304 Not Modified.
+"""
+
+import os
+from collections import OrderedDict
+from email.utils import formatdate
+from functools import lru_cache
+from mimetypes import guess_type
+from typing import Tuple
+import anyio
+from starlette.datastructures import Headers
+from starlette.responses import Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Receive, Scope, Send
+
+# Files above this size are streamed from disk by the stock FileResponse
+MAX_CACHED_FILE_SIZE = 64 * 1024
+
+# Maximum number of asset bodies kept in memory
+MAX_CACHED_FILES = 512
+
+# (path, mtime_ns, size) -> file content; the modification time and size are
+# part of the key, so an edited file produces a new entry instead of stale content
+_asset_cache: "OrderedDict[Tuple[str, int, int], bytes]" = OrderedDict()
+
+
+@lru_cache(maxsize=512)
+def _media_type(path: str) -> str:
+    """Guess an asset's media type from its file name.
+
+    Args:
+        path: Absolute path of the asset on disk
+
+    Returns:
+        Media type, or text/plain if it cannot be guessed
+    """
+    return guess_type(path)[0] or "text/plain"
+
+
+def _read_asset(path: str) -> bytes:
+    """Read a static asset from disk.
+
+    Args:
+        path: Absolute path of the asset on disk
+
+    Returns:
+        File content
+    """
+    with open(path, "rb") as f:
+        return f.read()
+
+
+class CachedAssetResponse(Response):
+    """Response for a small static asset, served from the in-memory cache.
+
+    Headers are built from the file's stat result, so only the body needs
+    the file content. On a cache miss the file is read in a worker thread
+    rather than on the event loop.
+    """
+
+    def __init__(self, path: str, stat_result: os.stat_result, status_code: int, headers: dict):
+        super().__init__(status_code=status_code, headers=headers, media_type=_media_type(path))
+        self.headers["content-length"] = str(stat_result.st_size)
+        self.cache_key = (path, stat_result.st_mtime_ns, stat_result.st_size)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["method"] != "HEAD":
+            body = _asset_cache.get(self.cache_key)
+            if body is None:
+                body = await anyio.to_thread.run_sync(_read_asset, self.cache_key[0])
+                _asset_cache[self.cache_key] = body
+                while len(_asset_cache) > MAX_CACHED_FILES:
+                    _asset_cache.popitem(last=False)
+            else:
+                _asset_cache.move_to_end(self.cache_key)
+            self.body = body
+        await super().__call__(scope, receive, send)
+
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles variant that serves small assets from memory.
+
+    Files up to MAX_CACHED_FILE_SIZE are read once per modification time and
+    returned from an LRU cache. Larger files and Range requests fall back to
+    the default FileResponse path, which supports partial content.
+    """
+
+    def file_response(
+        self,
+        full_path,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        request_headers = Headers(scope=scope)
+        if stat_result.st_size > MAX_CACHED_FILE_SIZE or "range" in request_headers:
+            return super().file_response(full_path, stat_result, scope, status_code)
+
+        headers = {
+            "accept-ranges": "bytes",
+            "etag": f'"{stat_result.st_size:x}-{stat_result.st_mtime_ns:x}"',
+            "last-modified": formatdate(stat_result.st_mtime, usegmt=True),
+        }
+
+        if self.is_not_modified(Headers(headers), request_headers):
+            return NotModifiedResponse(Headers(headers))
+        return CachedAssetResponse(str(full_path), stat_result, status_code, headers)